@@ -5,6 +5,8 @@ containers=(
     "spx_01_source_info"
     "spx_02_source_prices"
     "spx_03_source_financials"
+    "spx_04_compute_indicators"
+    "spx_05_export_snapshot"
     "spx_11_source_info_gdrive"
     "spx_12_source_prices_gdrive"
     "spx_13_source_financials_gdrive"
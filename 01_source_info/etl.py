@@ -1,7 +1,7 @@
 import os
 import psycopg2
-from psycopg2.extras import execute_values
 from data_fetcher import fetch_sp500_companies
+from loader import check_refresh, record_etl_run, refresh_catalog, replace_table
 
 host = os.getenv('HOST')
 port = os.getenv('PORT')
@@ -9,16 +9,23 @@ user = os.getenv('USER')
 password = os.getenv('PGPASSWORD')
 database = os.getenv('DATABASE')
 
+# 'copy' streams the load with COPY FROM STDIN, 'insert' uses execute_values
+load_method = os.getenv('LOAD_METHOD', 'copy')
+# Share of the stored tickers a full refresh must fetch, otherwise the run fails and keeps the stored data
+refresh_min_ratio = float(os.getenv('REFRESH_MIN_RATIO', '0.9'))
+
 try:
     conn = psycopg2.connect(host=host, port=port, user=user, password=password, dbname=database)
     cur = conn.cursor()
 
     df_info = fetch_sp500_companies()
 
-    cur.execute("DELETE FROM spx.info")
-    conn.commit()
-    execute_values(cur, "INSERT INTO spx.info VALUES %s", df_info.to_records(index=False))
+    # Load into a staging table and swap it in, readers see the old rows until the commit
     print("Replacing data in spx.info")
+    check_refresh(cur, 'spx.info', df_info, 'symbol', min_ratio=refresh_min_ratio)
+    replace_table(cur, 'spx.info', df_info, method=load_method)
+    refresh_catalog(cur, 'info')
+    record_etl_run(cur, 'info', len(df_info))
     conn.commit()
     print("Data loaded successfully")
 except Exception as e:
@@ -2,8 +2,116 @@ import pandas as pd
 import yfinance as yf
 from datetime import datetime, timedelta
 from tqdm import tqdm
+try:
+    from throttling import TokenBucket, retry_with_backoff
+except ModuleNotFoundError:
+    # Imported as 02_source_prices.data_fetcher (e.g. from the unit tests)
+    from .throttling import TokenBucket, retry_with_backoff
 
-def fetch_stock_prices(symbols, start_date=None, end_date=None):
+# Column order of the wide layout (and of spx.prices_wide)
+WIDE_COLUMNS = ['Date', 'Ticker', 'Open', 'High', 'Low', 'Close', 'Volume']
+
+def _select_ticker(df_batch, ticker):
+    """
+    Extract the OHLCV frame of a single ticker from a yf.download result.
+
+    Multi-ticker downloads (group_by='ticker') return columns indexed by
+    (Ticker, Price); single-ticker downloads may return plain Price columns.
+    Rows where every value is missing (dates only traded by other tickers in
+    the batch, or a failed download) are dropped.
+    """
+    if isinstance(df_batch.columns, pd.MultiIndex):
+        if ticker not in df_batch.columns.get_level_values(0):
+            return pd.DataFrame()
+        df_temp = df_batch[ticker].copy()
+    else:
+        df_temp = df_batch.copy()
+    return df_temp.dropna(how='all')
+
+def _melt_prices(df_temp, ticker):
+    """Melt a single ticker's OHLCV frame into Date/Ticker/Metric/Value rows."""
+    # Convert the index before melting so the melted rows of a bar share one date object
+    df_temp.index = pd.Index(pd.to_datetime(df_temp.index).date, name='Date')
+    df_temp['Ticker'] = ticker
+    return pd.melt(df_temp.reset_index(),
+                   id_vars=['Date', 'Ticker'],
+                   var_name='Metric',
+                   value_name='Value')
+
+def _wide_prices(df_temp, ticker):
+    """Shape a single ticker's OHLCV frame into Date/Ticker/Open/High/Low/Close/Volume rows."""
+    df_temp = df_temp.reindex(columns=WIDE_COLUMNS[2:]).astype(float)
+    df_temp.index = pd.Index(pd.to_datetime(df_temp.index).date, name='Date')
+    df_temp.insert(0, 'Ticker', ticker)
+    return df_temp.reset_index()
+
+def iter_stock_prices(symbols, start_date=None, end_date=None, start_dates=None, batch_size=50,
+                      max_workers=None, requests_per_second=None, retries=3, layout='long'):
+    """
+    Yield stock prices from Yahoo Finance one ticker at a time.
+
+    Takes the same arguments as fetch_stock_prices. Each yielded DataFrame holds the
+    rows of a single ticker in the requested layout, so callers can stream them to a
+    loader or concatenate them once instead of growing an accumulator per ticker.
+    """
+    if end_date is None:
+        end_date = datetime.now() - timedelta(days=1)
+    if start_date is None:
+        start_date = end_date - timedelta(days=10*365)
+
+    if start_dates is None:
+        start_dates = {}
+    rate_limiter = TokenBucket(requests_per_second) if requests_per_second else None
+    shape = _wide_prices if layout == 'wide' else _melt_prices
+
+    def download(tickers, start):
+        return retry_with_backoff(lambda: yf.download(tickers,
+                                                      start=start.strftime('%Y-%m-%d'),
+                                                      end=end_date.strftime('%Y-%m-%d'),
+                                                      auto_adjust=True,
+                                                      group_by='ticker',
+                                                      threads=max_workers or True,
+                                                      progress=False),
+                                  retries=retries,
+                                  rate_limiter=rate_limiter)
+
+    # Group symbols sharing a start date so each batch can be a single request
+    groups = {}
+    for ticker in symbols:
+        ticker_start = start_dates.get(ticker, start_date)
+        if ticker_start < end_date:
+            groups.setdefault(ticker_start, []).append(ticker)
+    batches = [(batch_start, tickers[i:i + batch_size])
+               for batch_start, tickers in groups.items()
+               for i in range(0, len(tickers), batch_size)]
+
+    for batch_start, batch in tqdm(batches, desc="Fetching stock data"):
+        frames = {}
+        try:
+            df_batch = download(batch, batch_start)
+            for ticker in batch:
+                df_temp = _select_ticker(df_batch, ticker)
+                if not df_temp.empty:
+                    frames[ticker] = df_temp
+        except Exception as e:
+            print(f"Error fetching batch starting with {batch[0]}: {e}")
+
+        # Retry the tickers that failed within a multi-ticker batch one at a time
+        failed = [ticker for ticker in batch if ticker not in frames] if len(batch) > 1 else []
+        for ticker in failed:
+            try:
+                df_temp = _select_ticker(download(ticker, batch_start), ticker)
+                if not df_temp.empty:
+                    frames[ticker] = df_temp
+            except Exception as e:
+                print(f"Error fetching data for {ticker}: {e}")
+
+        for ticker in batch:
+            if ticker in frames:
+                yield shape(frames[ticker], ticker)
+
+def fetch_stock_prices(symbols, start_date=None, end_date=None, start_dates=None, batch_size=50,
+                       max_workers=None, requests_per_second=None, retries=3, layout='long'):
     """
     Fetch stock prices for given symbols from Yahoo Finance.
 
@@ -11,16 +119,33 @@ def fetch_stock_prices(symbols, start_date=None, end_date=None):
         symbols (list): List of stock symbols to fetch data for.
         start_date (datetime, optional): Start date for data fetching. Defaults to 10 years ago.
         end_date (datetime, optional): End date for data fetching. Defaults to yesterday.
+        start_dates (dict, optional): Mapping of symbol to a start date (datetime) that
+            overrides start_date for that symbol. Used for incremental loads so that only
+            bars after the latest stored date are requested. Symbols whose start date is
+            not before end_date are already up to date and are skipped.
+        batch_size (int, optional): Number of symbols requested per yf.download call.
+            Defaults to 50. Use 1 to download one symbol at a time.
+        max_workers (int, optional): Number of threads yfinance uses to download the
+            symbols of a batch concurrently. Defaults to yfinance's own choice.
+        requests_per_second (float, optional): Token-bucket limit on yf.download calls.
+            Defaults to None (unlimited).
+        retries (int, optional): Retries per download, with exponential backoff, when
+            a request raises. Defaults to 3.
+        layout (str, optional): 'long' for one row per date, symbol and metric, or
+            'wide' for one row per date and symbol. Defaults to 'long'.
 
     Returns:
         pandas.DataFrame: A DataFrame containing the fetched stock price data.
 
-    The returned DataFrame has the following columns:
+    With layout='long' the returned DataFrame has the following columns:
     - Date: The date of the price data
     - Ticker: The stock symbol
     - Metric: The type of price data (Open, High, Low, Close, Volume)
     - Value: The value of the metric
 
+    With layout='wide' it has the columns Date, Ticker, Open, High, Low, Close
+    and Volume instead, matching spx.prices_wide.
+
     Example:
         ```python
         symbols = ['AAPL', 'GOOGL', 'MSFT']
@@ -30,30 +155,16 @@ def fetch_stock_prices(symbols, start_date=None, end_date=None):
 
     Note:
         This function uses the yfinance library to fetch data from Yahoo Finance.
-        It handles errors for individual stocks and continues with the next one.
+        Symbols are downloaded in batches; symbols that fail within a batch are
+        retried individually, and errors for individual stocks are printed before
+        continuing with the next one. Batches are requested one after another
+        because yf.download keeps its results in module-level state that is not
+        safe to share between concurrent calls; concurrency happens inside a batch.
     """
-    if end_date is None:
-        end_date = datetime.now() - timedelta(days=1)
-    if start_date is None:
-        start_date = end_date - timedelta(days=10*365)
-
-    df_prices = pd.DataFrame()
-
-    for ticker in tqdm(symbols, desc="Fetching stock data"):
-        try:
-            df_temp = yf.download(ticker,
-                                  start=start_date.strftime('%Y-%m-%d'),
-                                  end=end_date.strftime('%Y-%m-%d'),
-                                  auto_adjust=True)
-            df_temp['Ticker'] = ticker
-            df_melt = pd.melt(df_temp.reset_index(),
-                              id_vars=['Date', 'Ticker'],
-                              var_name='Metric',
-                              value_name='Value')
-            df_prices = pd.concat([df_prices, df_melt], ignore_index=True)
-        except Exception as e:
-            print(f"Error fetching data for {ticker}: {e}")
-
-    df_prices['Date'] = pd.to_datetime(df_prices['Date']).dt.date
+    frames = list(iter_stock_prices(symbols, start_date, end_date, start_dates, batch_size,
+                                    max_workers, requests_per_second, retries, layout))
+    if not frames:
+        return pd.DataFrame(columns=WIDE_COLUMNS if layout == 'wide' else ['Date', 'Ticker', 'Metric', 'Value'])
 
-    return df_prices
+    # Concatenate once instead of re-copying the accumulated frame per ticker
+    return pd.concat(frames, ignore_index=True)
@@ -2,8 +2,10 @@ import os
 import pandas as pd
 import psycopg2
 from psycopg2.extras import execute_values
-from tqdm import tqdm
-from data_fetcher import fetch_stock_prices
+from datetime import datetime, timedelta
+from data_fetcher import fetch_stock_prices, iter_stock_prices
+from loader import check_refresh, record_etl_run, refresh_catalog, refresh_materialized_view
+from partitions import create_partitions, drop_partitions_before, list_partitions, stage_partition, swap_partition
 
 host = os.getenv('HOST')
 port = os.getenv('PORT')
@@ -11,6 +13,48 @@ user = os.getenv('USER')
 password = os.getenv('PGPASSWORD')
 database = os.getenv('DATABASE')
 
+# 'incremental' appends new bars after each ticker's latest stored date,
+# 'full' re-downloads the whole history (picks up split/dividend re-adjustments)
+load_mode = os.getenv('PRICES_LOAD_MODE', 'incremental')
+# Day of the week (Monday=0 ... Sunday=6) on which incremental runs do a full refresh
+full_refresh_weekday = int(os.getenv('PRICES_FULL_REFRESH_WEEKDAY', '6'))
+# Number of tickers requested per Yahoo Finance download
+batch_size = int(os.getenv('PRICES_BATCH_SIZE', '50'))
+# Download threads per batch and a cap on yf.download calls per second (0 disables it)
+max_workers = int(os.getenv('PRICES_MAX_WORKERS', '8'))
+requests_per_second = float(os.getenv('PRICES_REQUESTS_PER_SECOND', '1'))
+# Years of prices kept in spx.prices_wide, older yearly partitions are dropped
+retention_years = int(os.getenv('PRICES_RETENTION_YEARS', '10'))
+# 'copy' streams full loads with COPY FROM STDIN, 'insert' uses execute_values
+load_method = os.getenv('LOAD_METHOD', 'copy')
+# Share of the stored tickers a full refresh must fetch, otherwise the run fails and keeps the stored data
+refresh_min_ratio = float(os.getenv('REFRESH_MIN_RATIO', '0.9'))
+
+def fetch_high_water_marks(cur):
+    """
+    Return the latest stored price date for every ticker in spx.prices_wide.
+
+    Returns:
+        dict: Mapping of ticker to the max(date) found in spx.prices_wide.
+    """
+    cur.execute("SELECT ticker, max(date) FROM spx.prices_wide GROUP BY ticker")
+    return dict(cur.fetchall())
+
+def upsert_prices(cur, df_prices, page_size=1000):
+    """
+    Insert wide price rows into spx.prices_wide, overwriting the OHLCV values
+    of rows that already exist for the same (ticker, date).
+    """
+    # NaN would be stored as the float NaN, missing values must be NULL
+    records = df_prices.astype(object).where(df_prices.notna(), None)
+    execute_values(cur,
+                   "INSERT INTO spx.prices_wide (date, ticker, open, high, low, close, volume) VALUES %s "
+                   "ON CONFLICT (ticker, date) DO UPDATE SET "
+                   "open = EXCLUDED.open, high = EXCLUDED.high, low = EXCLUDED.low, "
+                   "close = EXCLUDED.close, volume = EXCLUDED.volume",
+                   records.itertuples(index=False, name=None),
+                   page_size=page_size)
+
 try:
     conn = psycopg2.connect(host=host, port=port, user=user, password=password, dbname=database)
     cur = conn.cursor()
@@ -19,24 +63,66 @@ try:
     cur.execute("SELECT symbol FROM spx.info")
     df_symbols = pd.DataFrame(cur.fetchall(), columns=['symbol'])
 
-    # Fetch stock prices
-    df_prices = fetch_stock_prices(df_symbols['symbol'].tolist())
+    # Decide between a full refresh and an incremental load
+    high_water_marks = fetch_high_water_marks(cur)
+    full_refresh = (load_mode == 'full'
+                    or datetime.now().weekday() == full_refresh_weekday
+                    or not high_water_marks)
+    print(f"Load mode: {'full refresh' if full_refresh else 'incremental'}")
 
-    # Output retrieved prices
-    print(df_prices)
-
-    # Delete existing price data
-    cur.execute("DELETE FROM spx.prices")
+    # Create the yearly partitions of the retention window (including next year's) and drop expired ones
+    first_year = datetime.now().year - retention_years
+    create_partitions(cur, 'spx.prices_wide', first_year, datetime.now().year + 1)
+    for partition in drop_partitions_before(cur, 'spx.prices_wide', first_year):
+        print(f"Dropped partition {partition}")
     conn.commit()
-    print("Data deleted successfully!")
 
-    # Insert new price data
-    chunk_size = 1000
-    for i in tqdm(range(0, len(df_prices), chunk_size), desc="Inserting data"):
-        chunk = df_prices[i:i + chunk_size]
-        execute_values(cur, "INSERT INTO spx.prices VALUES %s", chunk.to_records(index=False))
-    conn.commit()
-    print("Data inserted successfully!")
+    if full_refresh:
+        # Fetch stock prices
+        df_prices = fetch_stock_prices(df_symbols['symbol'].tolist(),
+                                       batch_size=batch_size,
+                                       max_workers=max_workers,
+                                       requests_per_second=requests_per_second,
+                                       layout='wide')
+
+        # Output retrieved prices
+        print(df_prices)
+
+        # Load and index every year in a staging table first, then exchange them all for the
+        # live partitions at the end: the swaps lock spx.prices_wide until the commit
+        check_refresh(cur, 'spx.prices_wide', df_prices, 'Ticker', min_ratio=refresh_min_ratio)
+        years = pd.to_datetime(df_prices['Date']).dt.year
+        partition_years = sorted(list_partitions(cur, 'spx.prices_wide'))
+        for year in partition_years:
+            stage_partition(cur, 'spx.prices_wide', year, df_prices[years == year], method=load_method)
+        for year in partition_years:
+            swap_partition(cur, 'spx.prices_wide', year)
+        refresh_catalog(cur, 'prices')
+        refresh_materialized_view(cur, 'spx.ticker_summary')
+        record_etl_run(cur, 'prices', len(df_prices))
+        conn.commit()
+        print("Data inserted successfully!")
+    else:
+        # Only request bars after the latest stored date of each ticker,
+        # tickers without stored prices get the default full history
+        start_dates = {ticker: datetime.combine(max_date + timedelta(days=1), datetime.min.time())
+                       for ticker, max_date in high_water_marks.items()}
+        # Stream each ticker's new rows straight into the upsert, committing once
+        rows = 0
+        for df_ticker in iter_stock_prices(df_symbols['symbol'].tolist(),
+                                           start_dates=start_dates,
+                                           batch_size=batch_size,
+                                           max_workers=max_workers,
+                                           requests_per_second=requests_per_second,
+                                           layout='wide'):
+            df_ticker = df_ticker.drop_duplicates(subset=['Date', 'Ticker'], keep='last')
+            upsert_prices(cur, df_ticker)
+            rows += len(df_ticker)
+        refresh_catalog(cur, 'prices')
+        refresh_materialized_view(cur, 'spx.ticker_summary')
+        record_etl_run(cur, 'prices', rows)
+        conn.commit()
+        print(f"{rows} rows upserted successfully!")
 
 except Exception as e:
     print("Error: ", e)
@@ -0,0 +1,115 @@
+import re
+try:
+    from loader import load_dataframe
+except ModuleNotFoundError:
+    # Imported as 02_source_prices.partitions (e.g. from the unit tests)
+    from .loader import load_dataframe
+
+def list_partitions(cur, table):
+    """
+    Return the yearly partitions of a range-partitioned table.
+
+    Partitions follow the naming convention <table>_<year>, e.g. spx.prices_wide_2024.
+
+    Returns:
+        dict: Mapping of year (int) to the schema-qualified partition name.
+    """
+    schema, name = table.split('.')
+    cur.execute("SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = %s::regclass", (table,))
+    partitions = {}
+    for (relname,) in cur.fetchall():
+        match = re.fullmatch(re.escape(name) + r'_(\d{4})', relname)
+        if match:
+            partitions[int(match.group(1))] = f"{schema}.{relname}"
+    return partitions
+
+def _parent_indexes(cur, table):
+    """Return (index name, CREATE INDEX statement) pairs of the partitioned indexes of a table."""
+    schema, name = table.split('.')
+    cur.execute("SELECT indexname, indexdef FROM pg_indexes WHERE schemaname = %s AND tablename = %s",
+                (schema, name))
+    return cur.fetchall()
+
+def create_partitions(cur, table, first_year, last_year):
+    """Create the yearly partitions of table from first_year to last_year (inclusive) that do not exist yet."""
+    for year in range(first_year, last_year + 1):
+        cur.execute(f"CREATE TABLE IF NOT EXISTS {table}_{year} PARTITION OF {table} "
+                    f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')")
+
+def drop_partitions_before(cur, table, year):
+    """
+    Drop the yearly partitions of table that end before the given year.
+
+    Retention is enforced by dropping whole partitions, which only removes
+    their files instead of deleting and vacuuming millions of rows.
+
+    Returns:
+        list: Names of the dropped partitions.
+    """
+    dropped = [partition for partition_year, partition in sorted(list_partitions(cur, table).items())
+               if partition_year < year]
+    for partition in dropped:
+        cur.execute(f"DROP TABLE {partition}")
+    return dropped
+
+def stage_partition(cur, table, year, df, date_column='date', method='copy'):
+    """
+    Load the new contents of one yearly partition into a staging table.
+
+    The rows are loaded into an unindexed {table}_<year>_staging table shaped
+    like the parent, the parent's indexes are built on it, and a CHECK
+    constraint matching the partition bounds lets ATTACH PARTITION skip
+    validating every row. Only the new table is locked, readers of the parent
+    table are not blocked; swap_partition later exchanges it for the live one.
+
+    Args:
+        cur (psycopg2.extensions.cursor): Cursor of the loading transaction.
+        table (str): Schema-qualified partitioned table, e.g. 'spx.prices_wide'.
+        year (int): Year of the partition to replace.
+        df (pandas.DataFrame): Rows of that year, with columns in the table's column order.
+        date_column (str, optional): Partition key column. Defaults to 'date'.
+        method (str, optional): Load method passed to load_dataframe. Defaults to 'copy'.
+    """
+    schema, name = table.split('.')
+    staging = f"{table}_{year}_staging"
+
+    cur.execute(f"DROP TABLE IF EXISTS {staging}")
+    cur.execute(f"CREATE TABLE {staging} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+    load_dataframe(cur, df, staging, method=method)
+    for index_name, index_def in _parent_indexes(cur, table):
+        cur.execute(index_def.replace(f" {index_name} ON ONLY {table} ",
+                                      f" {index_name}_{year}_staging ON {staging} ", 1))
+    cur.execute(f"ALTER TABLE {staging} ADD CONSTRAINT {name}_{year}_staging_bounds "
+                f"CHECK ({date_column} IS NOT NULL AND {date_column} >= '{year}-01-01' "
+                f"AND {date_column} < '{year + 1}-01-01')")
+    cur.execute(f"ANALYZE {staging}")
+
+def swap_partition(cur, table, year):
+    """
+    Exchange the staging table of stage_partition for the live yearly partition.
+
+    The old partition is detached and dropped and the staging table attached in
+    its place. DETACH PARTITION takes an ACCESS EXCLUSIVE lock on the parent
+    table that is held until the commit, so call it for every year only after
+    all of them are staged, right before committing: readers then keep querying
+    the old prices during the load and wait only for the swap itself.
+
+    Args:
+        cur (psycopg2.extensions.cursor): Cursor of the loading transaction.
+        table (str): Schema-qualified partitioned table, e.g. 'spx.prices_wide'.
+        year (int): Year of the partition to replace.
+    """
+    schema, name = table.split('.')
+    partition = f"{table}_{year}"
+
+    if year in list_partitions(cur, table):
+        cur.execute(f"ALTER TABLE {table} DETACH PARTITION {partition}")
+        cur.execute(f"DROP TABLE {partition}")
+    cur.execute(f"ALTER TABLE {partition}_staging RENAME TO {name}_{year}")
+    for index_name, _ in _parent_indexes(cur, table):
+        cur.execute(f"ALTER INDEX {schema}.{index_name}_{year}_staging RENAME TO {index_name}_{year}")
+    cur.execute(f"ALTER TABLE {table} ATTACH PARTITION {partition} "
+                f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')")
+    cur.execute(f"ALTER TABLE {partition} DROP CONSTRAINT {name}_{year}_staging_bounds")
@@ -2,13 +2,65 @@ import pandas as pd
 import yfinance as yf
 from tqdm import tqdm
 import warnings
+try:
+    from throttling import TokenBucket, retry_with_backoff, map_ordered
+except ModuleNotFoundError:
+    # Imported as 03_source_financials.data_fetcher (e.g. from the unit tests)
+    from .throttling import TokenBucket, retry_with_backoff, map_ordered
 
-def fetch_quarterly_financials(symbols):
+def _fetch_ticker_financials(ticker, rate_limiter=None, retries=3):
+    """
+    Fetch and melt the quarterly financials of a single ticker.
+
+    Returns None (after printing the error) when the ticker still fails after
+    all retries, so one bad symbol does not stop the other workers.
+    """
+    try:
+        df_temp = retry_with_backoff(lambda: yf.Ticker(ticker).quarterly_financials,
+                                     retries=retries,
+                                     rate_limiter=rate_limiter)
+        df_temp = df_temp.transpose().reset_index()
+        df_temp['Ticker'] = ticker
+        df_melt = pd.melt(df_temp, id_vars=['Ticker', 'index'])
+        df_melt = df_melt.rename(columns={'index': 'Date'})
+        df_melt['Date'] = pd.to_datetime(df_melt['Date']).dt.date
+        return df_melt
+    except Exception as e:
+        print(f"Error fetching data for {ticker}: {e}")
+        return None
+
+def iter_quarterly_financials(symbols, max_workers=1, requests_per_second=None, retries=3):
+    """
+    Yield quarterly financial data from Yahoo Finance one ticker at a time.
+
+    Takes the same arguments as fetch_quarterly_financials. Each yielded DataFrame
+    holds the Ticker/Date/variable/value rows of a single ticker, in the order of
+    symbols regardless of which worker finished first.
+    """
+    warnings.filterwarnings('ignore')
+    rate_limiter = TokenBucket(requests_per_second) if requests_per_second else None
+
+    def fetch(ticker):
+        return _fetch_ticker_financials(ticker, rate_limiter, retries)
+
+    for df_melt in tqdm(map_ordered(fetch, symbols, max_workers),
+                        total=len(symbols),
+                        desc="Fetching financial data"):
+        if df_melt is not None:
+            yield df_melt
+
+def fetch_quarterly_financials(symbols, max_workers=1, requests_per_second=None, retries=3):
     """
     Fetch quarterly financial data for given symbols from Yahoo Finance.
 
     Args:
         symbols (list): List of stock symbols to fetch data for.
+        max_workers (int, optional): Number of tickers fetched concurrently on a
+            thread pool. Defaults to 1 (sequential).
+        requests_per_second (float, optional): Token-bucket limit on Yahoo Finance
+            requests shared by all workers. Defaults to None (unlimited).
+        retries (int, optional): Retries per ticker, with exponential backoff, when
+            a request raises. Defaults to 3.
 
     Returns:
         pandas.DataFrame: A DataFrame containing the fetched quarterly financial data.
@@ -29,22 +81,12 @@ def fetch_quarterly_financials(symbols):
     Note:
         This function uses the yfinance library to fetch data from Yahoo Finance.
         It handles errors for individual stocks and continues with the next one.
+        Rows are returned in the order of symbols even when fetched concurrently.
         Warnings are suppressed to avoid cluttering the output.
     """
-    warnings.filterwarnings('ignore')
-    df_fundamentals = pd.DataFrame()
-
-    for ticker in tqdm(symbols, desc="Fetching financial data"):
-        try:
-            stock = yf.Ticker(ticker)
-            df_temp = stock.quarterly_financials.transpose().reset_index()
-            df_temp['Ticker'] = ticker
-            df_melt = pd.melt(df_temp, id_vars=['Ticker', 'index'])
-            df_fundamentals = pd.concat([df_fundamentals, df_melt], ignore_index=True)
-        except Exception as e:
-            print(f"Error fetching data for {ticker}: {e}")
-
-    df_fundamentals = df_fundamentals.rename(columns={'index': 'Date'})
-    df_fundamentals['Date'] = pd.to_datetime(df_fundamentals['Date']).dt.date
-
-    return df_fundamentals
+    frames = list(iter_quarterly_financials(symbols, max_workers, requests_per_second, retries))
+    if not frames:
+        return pd.DataFrame(columns=['Ticker', 'Date', 'variable', 'value'])
+
+    # Concatenate once instead of re-copying the accumulated frame per ticker
+    return pd.concat(frames, ignore_index=True)
@@ -1,9 +1,8 @@
 import os
 import pandas as pd
 import psycopg2
-from psycopg2.extras import execute_values
-from tqdm import tqdm
 from data_fetcher import fetch_quarterly_financials
+from loader import check_refresh, record_etl_run, refresh_catalog, replace_table
 
 host = os.getenv('HOST')
 port = os.getenv('PORT')
@@ -11,6 +10,14 @@ user = os.getenv('USER')
 password = os.getenv('PGPASSWORD')
 database = os.getenv('DATABASE')
 
+# Tickers fetched concurrently and a cap on Yahoo Finance requests per second (0 disables it)
+max_workers = int(os.getenv('FINANCIALS_MAX_WORKERS', '8'))
+requests_per_second = float(os.getenv('FINANCIALS_REQUESTS_PER_SECOND', '4'))
+# 'copy' streams the load with COPY FROM STDIN, 'insert' uses execute_values
+load_method = os.getenv('LOAD_METHOD', 'copy')
+# Share of the stored tickers a full refresh must fetch, otherwise the run fails and keeps the stored data
+refresh_min_ratio = float(os.getenv('REFRESH_MIN_RATIO', '0.9'))
+
 try:
     conn = psycopg2.connect(host=host, port=port, user=user, password=password, dbname=database)
     cur = conn.cursor()
@@ -20,20 +27,18 @@ try:
     df_symbols = pd.DataFrame(cur.fetchall(), columns=['symbol'])
 
     # Fetch quarterly financials
-    df_fundamentals = fetch_quarterly_financials(df_symbols['symbol'].tolist())
+    df_fundamentals = fetch_quarterly_financials(df_symbols['symbol'].tolist(),
+                                                 max_workers=max_workers,
+                                                 requests_per_second=requests_per_second)
 
     # Output retrieved financials
     print(df_fundamentals)
 
-    # Delete existing financials data
-    cur.execute("DELETE FROM spx.financials")
-    conn.commit()
-
-    # Insert new financials data
-    chunk_size = 1000
-    for i in tqdm(range(0, len(df_fundamentals), chunk_size), desc="Inserting data"):
-        chunk = df_fundamentals[i:i + chunk_size]
-        execute_values(cur, "INSERT INTO spx.financials VALUES %s", chunk.to_records(index=False))
+    # Load into a staging table and swap it in, readers see the old rows until the commit
+    check_refresh(cur, 'spx.financials', df_fundamentals, 'Ticker', min_ratio=refresh_min_ratio)
+    replace_table(cur, 'spx.financials', df_fundamentals, method=load_method)
+    refresh_catalog(cur, 'financials')
+    record_etl_run(cur, 'financials', len(df_fundamentals))
     print("Data inserted successfully!")
     conn.commit()
 
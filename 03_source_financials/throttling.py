@@ -0,0 +1,99 @@
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Tokens are replenished continuously at `rate` per second up to `capacity`.
+    Every call to acquire() consumes one token, blocking until one is available,
+    which keeps concurrent workers under a shared request rate.
+
+    Args:
+        rate (float): Number of tokens added per second.
+        capacity (int, optional): Maximum burst size. Defaults to max(1, rate).
+
+    Example:
+        ```python
+        bucket = TokenBucket(rate=2)
+        for ticker in symbols:
+            bucket.acquire()
+            yf.Ticker(ticker).quarterly_financials
+        ```
+    """
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available and consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+def retry_with_backoff(func, retries=3, base_delay=1.0, max_delay=30.0, rate_limiter=None):
+    """
+    Call func(), retrying on exceptions with exponential backoff.
+
+    The delay before retry n is base_delay * 2**n (capped at max_delay) with
+    random jitter, so concurrent workers that were throttled together do not
+    retry in lockstep. A token is taken from rate_limiter before every attempt.
+
+    Args:
+        func (callable): Function without arguments to call.
+        retries (int, optional): Number of retries after the first attempt. Defaults to 3.
+        base_delay (float, optional): Delay in seconds before the first retry. Defaults to 1.
+        max_delay (float, optional): Upper bound for a single delay in seconds. Defaults to 30.
+        rate_limiter (TokenBucket, optional): Limiter shared by all workers.
+
+    Returns:
+        The return value of func().
+
+    Raises:
+        Exception: The last exception raised by func() once all retries are exhausted.
+    """
+    for attempt in range(retries + 1):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            return func()
+        except Exception:
+            if attempt == retries:
+                raise
+            delay = min(max_delay, base_delay * 2 ** attempt)
+            time.sleep(delay * random.uniform(0.5, 1.0))
+
+def map_ordered(func, items, max_workers=1):
+    """
+    Apply func to every item on a bounded thread pool, yielding results in input order.
+
+    At most 2 * max_workers calls are in flight or buffered at a time, so a slow
+    consumer does not cause results to pile up in memory. With max_workers <= 1
+    the items are processed sequentially in the calling thread.
+    """
+    if max_workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,3 @@
+#!/bin/bash
+
+docker build -t spx_04_compute_indicators .
@@ -0,0 +1,118 @@
+import io
+import os
+import pandas as pd
+import psycopg2
+from psycopg2.extras import execute_values
+from datetime import datetime
+from indicators import INDICATOR_COLUMNS, compute_indicators
+from loader import record_etl_run, refresh_catalog, replace_table
+
+host = os.getenv('HOST')
+port = os.getenv('PORT')
+user = os.getenv('USER')
+password = os.getenv('PGPASSWORD')
+database = os.getenv('DATABASE')
+
+# 'incremental' only computes the dates after each ticker's latest stored indicators,
+# 'full' recomputes the whole history from spx.prices_wide
+load_mode = os.getenv('INDICATORS_LOAD_MODE', 'incremental')
+# Day of the week (Monday=0 ... Sunday=6) on which incremental runs do a full refresh,
+# the same day the prices ETL re-downloads the adjusted history
+full_refresh_weekday = int(os.getenv('INDICATORS_FULL_REFRESH_WEEKDAY', '6'))
+# Calendar days of prices read before the new dates, enough for the 200-day SMA to be full
+lookback_days = int(os.getenv('INDICATORS_LOOKBACK_DAYS', '450'))
+# 'copy' streams full loads with COPY FROM STDIN, 'insert' uses execute_values
+load_method = os.getenv('LOAD_METHOD', 'copy')
+
+# Prices of tickers without indicators, and of the lookback window before each ticker's latest indicators
+TAIL_PRICES_QUERY = """
+    SELECT p.date, p.ticker, p.close
+    FROM spx.prices_wide AS p
+    LEFT JOIN (SELECT ticker, max(date) AS last_date FROM spx.indicators GROUP BY ticker) AS i USING (ticker)
+    WHERE i.last_date IS NULL OR p.date > i.last_date - %(lookback_days)s
+"""
+
+# Highest close of each ticker before its lookback window, which seeds the drawdown
+PRIOR_PEAKS_QUERY = """
+    SELECT p.ticker, max(p.close)
+    FROM spx.prices_wide AS p
+    JOIN (SELECT ticker, max(date) AS last_date FROM spx.indicators GROUP BY ticker) AS i USING (ticker)
+    WHERE p.date <= i.last_date - %(lookback_days)s
+    GROUP BY p.ticker
+"""
+
+def read_prices(cur, query, params=None):
+    """
+    Read the result of a price query into a DataFrame with COPY TO STDOUT.
+
+    COPY sends the rows as one CSV stream that pandas parses in C, which is
+    much faster than building a Python tuple per row with fetchall().
+    """
+    buffer = io.StringIO()
+    cur.copy_expert(f"COPY ({cur.mogrify(query, params).decode()}) TO STDOUT WITH (FORMAT csv, HEADER)", buffer)
+    buffer.seek(0)
+    return pd.read_csv(buffer, parse_dates=['date'])
+
+def fetch_high_water_marks(cur):
+    """Return the latest date with stored indicators for every ticker in spx.indicators."""
+    cur.execute("SELECT ticker, max(date) FROM spx.indicators GROUP BY ticker")
+    return dict(cur.fetchall())
+
+def upsert_indicators(cur, df_indicators, page_size=1000):
+    """
+    Insert indicator rows into spx.indicators, overwriting the values of rows
+    that already exist for the same (ticker, date).
+    """
+    columns = ['date', 'ticker'] + INDICATOR_COLUMNS
+    # NaN would be stored as the float NaN, missing values must be NULL
+    records = df_indicators[columns].astype(object).where(df_indicators[columns].notna(), None)
+    execute_values(cur,
+                   f"INSERT INTO spx.indicators ({', '.join(columns)}) VALUES %s "
+                   f"ON CONFLICT (ticker, date) DO UPDATE SET "
+                   f"{', '.join(f'{column} = EXCLUDED.{column}' for column in INDICATOR_COLUMNS)}",
+                   records.itertuples(index=False, name=None),
+                   page_size=page_size)
+
+try:
+    conn = psycopg2.connect(host=host, port=port, user=user, password=password, dbname=database)
+    cur = conn.cursor()
+
+    # Decide between a full refresh and an incremental load
+    high_water_marks = fetch_high_water_marks(cur)
+    full_refresh = (load_mode == 'full'
+                    or datetime.now().weekday() == full_refresh_weekday
+                    or not high_water_marks)
+    print(f"Load mode: {'full refresh' if full_refresh else 'incremental'}")
+
+    if full_refresh:
+        df_prices = read_prices(cur, "SELECT date, ticker, close FROM spx.prices_wide")
+        df_indicators = compute_indicators(df_prices)
+        print(df_indicators)
+
+        # Load into a staging table and swap it in, readers see the old rows until the commit
+        replace_table(cur, 'spx.indicators', df_indicators, method=load_method)
+        rows = len(df_indicators)
+    else:
+        # Recompute only the tail of every ticker's history and keep the dates after its latest indicators
+        params = {'lookback_days': lookback_days}
+        df_prices = read_prices(cur, TAIL_PRICES_QUERY, params)
+        cur.execute(PRIOR_PEAKS_QUERY, params)
+        df_indicators = compute_indicators(df_prices, prior_peaks=dict(cur.fetchall()))
+
+        last_dates = pd.to_datetime(df_indicators['ticker'].map(high_water_marks))
+        df_indicators = df_indicators[last_dates.isna() | (df_indicators['date'] > last_dates)]
+        print(df_indicators)
+
+        upsert_indicators(cur, df_indicators)
+        rows = len(df_indicators)
+
+    refresh_catalog(cur, 'indicators')
+    record_etl_run(cur, 'indicators', rows)
+    conn.commit()
+    print(f"{rows} indicator rows loaded successfully!")
+except Exception as e:
+    print("Error: ", e)
+    exit(1)
+finally:
+    if conn:
+        conn.close()
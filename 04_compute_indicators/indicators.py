@@ -0,0 +1,70 @@
+import numpy as np
+
+# Indicator windows, in trading days
+SMA_WINDOWS = (20, 50, 200)
+EMA_SPANS = (12, 26)
+VOLATILITY_WINDOW = 20
+RSI_WINDOW = 14
+TRADING_DAYS_PER_YEAR = 252
+
+INDICATOR_COLUMNS = (['log_return']
+                     + [f'sma_{window}' for window in SMA_WINDOWS]
+                     + [f'ema_{span}' for span in EMA_SPANS]
+                     + [f'volatility_{VOLATILITY_WINDOW}', f'rsi_{RSI_WINDOW}', 'drawdown'])
+
+def _per_ticker(result):
+    """Drop the ticker level that groupby().rolling()/ewm() prepend, realigning with the input rows."""
+    return result.reset_index(level=0, drop=True)
+
+def compute_indicators(df_prices, prior_peaks=None):
+    """
+    Compute technical indicators of every ticker's close prices in one vectorized pass.
+
+    The indicators are the daily log return, simple moving averages (SMA_WINDOWS),
+    exponential moving averages (EMA_SPANS), the annualized rolling volatility
+    of the log returns, Wilder's RSI and the drawdown from the running peak
+    close. Windows are counted in rows, i.e. trading days, and rows before a
+    window is full are NaN.
+
+    To recompute only the tail of the history, pass the prices of a lookback
+    window long enough for the longest SMA (the EMAs and the RSI converge well
+    within it) together with the peak close of each ticker before the window.
+
+    Args:
+        df_prices (pandas.DataFrame): Prices with 'date', 'ticker' and 'close' columns.
+        prior_peaks (dict, optional): Highest close of each ticker before the first row of df_prices.
+
+    Returns:
+        pandas.DataFrame: 'date', 'ticker' and the INDICATOR_COLUMNS, ordered by ticker and date.
+    """
+    df = df_prices[['date', 'ticker', 'close']].sort_values(['ticker', 'date'], kind='stable').reset_index(drop=True)
+    close = df['close'].astype(float)
+    by_ticker = close.groupby(df['ticker'], sort=False)
+
+    df_indicators = df[['date', 'ticker']].copy()
+    df_indicators['log_return'] = np.log(close).groupby(df['ticker'], sort=False).diff()
+
+    for window in SMA_WINDOWS:
+        df_indicators[f'sma_{window}'] = _per_ticker(by_ticker.rolling(window, min_periods=window).mean())
+    for span in EMA_SPANS:
+        df_indicators[f'ema_{span}'] = _per_ticker(by_ticker.ewm(span=span, adjust=False).mean())
+
+    df_indicators[f'volatility_{VOLATILITY_WINDOW}'] = _per_ticker(
+        df_indicators['log_return'].groupby(df['ticker'], sort=False)
+        .rolling(VOLATILITY_WINDOW, min_periods=VOLATILITY_WINDOW).std()
+    ) * np.sqrt(TRADING_DAYS_PER_YEAR)
+
+    # Wilder's RSI: exponentially smoothed gains and losses with alpha = 1 / window
+    delta = by_ticker.diff()
+    gains = delta.clip(lower=0).groupby(df['ticker'], sort=False)
+    losses = (-delta).clip(lower=0).groupby(df['ticker'], sort=False)
+    average_gain = _per_ticker(gains.ewm(alpha=1 / RSI_WINDOW, adjust=False, min_periods=RSI_WINDOW).mean())
+    average_loss = _per_ticker(losses.ewm(alpha=1 / RSI_WINDOW, adjust=False, min_periods=RSI_WINDOW).mean())
+    df_indicators[f'rsi_{RSI_WINDOW}'] = 100 - 100 / (1 + average_gain / average_loss)
+
+    peak = by_ticker.cummax()
+    if prior_peaks:
+        peak = np.fmax(peak, df['ticker'].map(prior_peaks).astype(float))
+    df_indicators['drawdown'] = close / peak - 1
+
+    return df_indicators
@@ -0,0 +1,254 @@
+import io
+import psycopg2
+from psycopg2.extras import execute_values
+from tqdm import tqdm
+
+def _column_list(df):
+    """Return the table columns matching the DataFrame columns, e.g. '(date, ticker, value)'."""
+    return f"({', '.join(str(column).lower() for column in df.columns)})"
+
+def copy_dataframe(cur, df, table, chunk_size=100000):
+    """
+    Bulk load a DataFrame into a table with COPY FROM STDIN.
+
+    Each chunk is written as CSV into an in-memory buffer by pandas and streamed
+    to PostgreSQL, so no per-row Python tuples are built. Missing values
+    (NaN/None) are loaded as NULL. DataFrame columns are matched to table
+    columns by their lower-cased names; table columns without a DataFrame
+    column (such as the surrogate id) get their default.
+
+    Args:
+        cur (psycopg2.extensions.cursor): Cursor of the loading transaction.
+        df (pandas.DataFrame): Rows to load, with columns named like the table's columns.
+        table (str): Target table, e.g. 'spx.prices'.
+        chunk_size (int, optional): Rows buffered per COPY statement. Defaults to 100000.
+    """
+    for i in tqdm(range(0, len(df), chunk_size), desc="Copying data"):
+        buffer = io.StringIO()
+        df.iloc[i:i + chunk_size].to_csv(buffer, index=False, header=False)
+        buffer.seek(0)
+        cur.copy_expert(f"COPY {table} {_column_list(df)} FROM STDIN WITH (FORMAT csv)", buffer)
+
+def insert_dataframe(cur, df, table, chunk_size=1000):
+    """
+    Insert a DataFrame into a table with execute_values in chunks.
+
+    DataFrame columns are matched to table columns as in copy_dataframe.
+
+    Args:
+        cur (psycopg2.extensions.cursor): Cursor of the loading transaction.
+        df (pandas.DataFrame): Rows to load, with columns named like the table's columns.
+        table (str): Target table, e.g. 'spx.prices'.
+        chunk_size (int, optional): Rows per INSERT statement. Defaults to 1000.
+    """
+    for i in tqdm(range(0, len(df), chunk_size), desc="Inserting data"):
+        chunk = df[i:i + chunk_size]
+        execute_values(cur, f"INSERT INTO {table} {_column_list(df)} VALUES %s", chunk.to_records(index=False))
+
+def load_dataframe(cur, df, table, method='copy'):
+    """
+    Load a DataFrame into a table, preferring COPY over execute_values.
+
+    With method='copy' the rows are streamed with copy_dataframe. If COPY is
+    rejected by the server, the partial load is rolled back to a savepoint and
+    the rows are inserted with insert_dataframe instead. Any other method
+    always uses insert_dataframe.
+
+    Args:
+        cur (psycopg2.extensions.cursor): Cursor of the loading transaction.
+        df (pandas.DataFrame): Rows to load, with columns named like the table's columns.
+        table (str): Target table, e.g. 'spx.prices'.
+        method (str, optional): 'copy' or 'insert'. Defaults to 'copy'.
+    """
+    if method == 'copy':
+        cur.execute("SAVEPOINT bulk_load")
+        try:
+            copy_dataframe(cur, df, table)
+            cur.execute("RELEASE SAVEPOINT bulk_load")
+            return
+        except psycopg2.Error as e:
+            print(f"COPY into {table} failed, falling back to INSERT: {e}")
+            cur.execute("ROLLBACK TO SAVEPOINT bulk_load")
+    insert_dataframe(cur, df, table)
+
+# Views (and materialized views) that depend on a relation, directly or through
+# other views, ordered so that every view comes after the views it selects from
+DEPENDENT_VIEWS_QUERY = """
+WITH RECURSIVE dependents(oid, depth) AS (
+    SELECT r.ev_class, 1
+    FROM pg_depend d
+    JOIN pg_rewrite r ON r.oid = d.objid
+    WHERE d.refobjid = %s::regclass AND r.ev_class <> d.refobjid
+    UNION
+    SELECT r.ev_class, dependents.depth + 1
+    FROM dependents
+    JOIN pg_depend d ON d.refobjid = dependents.oid
+    JOIN pg_rewrite r ON r.oid = d.objid
+    WHERE r.ev_class <> d.refobjid
+)
+SELECT c.oid::regclass::text, c.relkind, pg_get_viewdef(c.oid)
+FROM dependents
+JOIN pg_class c ON c.oid = dependents.oid
+GROUP BY c.oid, c.relkind
+ORDER BY max(dependents.depth)
+"""
+
+def _index_definitions(cur, relation):
+    """
+    Return the indexes of a schema-qualified relation.
+
+    Returns:
+        list: (index name, CREATE INDEX statement, constraint) tuples, where
+        constraint is 'PRIMARY KEY' or 'UNIQUE' for indexes backing a
+        constraint and None otherwise.
+    """
+    schema, name = relation.split('.')
+    cur.execute("SELECT i.indexname, i.indexdef, "
+                "CASE c.contype WHEN 'p' THEN 'PRIMARY KEY' WHEN 'u' THEN 'UNIQUE' END "
+                "FROM pg_indexes i "
+                "LEFT JOIN pg_constraint c ON c.conindid = format('%%I.%%I', i.schemaname, i.indexname)::regclass "
+                "WHERE i.schemaname = %s AND i.tablename = %s",
+                (schema, name))
+    return cur.fetchall()
+
+def _owned_sequences(cur, table):
+    """Return (sequence, column) pairs of the sequences owned by a table's serial columns."""
+    cur.execute("SELECT d.objid::regclass::text, a.attname FROM pg_depend d "
+                "JOIN pg_class s ON s.oid = d.objid AND s.relkind = 'S' "
+                "JOIN pg_attribute a ON a.attrelid = d.refobjid AND a.attnum = d.refobjsubid "
+                "WHERE d.refobjid = %s::regclass AND d.deptype = 'a'", (table,))
+    return cur.fetchall()
+
+def replace_table(cur, table, df, method='copy'):
+    """
+    Replace the contents of a table by loading a staging copy and swapping it in.
+
+    The rows are loaded into an unindexed {table}_staging table, the indexes of
+    the live table are built on it afterwards, and the staging table is renamed
+    over the live one. Views that depend on the live table are bound to it, so
+    they are recreated on the new table as part of the swap. Nothing is committed
+    here: when the caller commits, readers switch from the old to the new data in
+    one step and never see an empty or partially loaded table, and no dead rows
+    are left behind to vacuum.
+
+    Args:
+        cur (psycopg2.extensions.cursor): Cursor of the loading transaction.
+        table (str): Schema-qualified live table, e.g. 'spx.prices'.
+        df (pandas.DataFrame): New rows, with columns named like the table's columns.
+        method (str, optional): Load method passed to load_dataframe. Defaults to 'copy'.
+    """
+    schema, name = table.split('.')
+    staging = f"{table}_staging"
+
+    # Load into a staging copy of the table, then index it
+    cur.execute(f"DROP TABLE IF EXISTS {staging}")
+    cur.execute(f"CREATE TABLE {staging} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+    load_dataframe(cur, df, staging, method=method)
+    indexes = _index_definitions(cur, table)
+    for index_name, index_def, constraint in indexes:
+        cur.execute(index_def.replace(f" {index_name} ON {table} ",
+                                      f" {index_name}_staging ON {staging} ", 1))
+        if constraint:
+            cur.execute(f"ALTER TABLE {staging} ADD CONSTRAINT {index_name}_staging "
+                        f"{constraint} USING INDEX {index_name}_staging")
+    cur.execute(f"ANALYZE {staging}")
+
+    # Capture dependent views before the swap drops them
+    cur.execute(DEPENDENT_VIEWS_QUERY, (table,))
+    views = [(view, relkind, view_def, _index_definitions(cur, view))
+             for view, relkind, view_def in cur.fetchall()]
+
+    # Serial columns of the staging table draw from the live table's sequences,
+    # hand their ownership over so they survive dropping the old table
+    sequences = _owned_sequences(cur, table)
+
+    # Swap the staging table in and recreate the dependent views on it
+    cur.execute(f"ALTER TABLE {table} RENAME TO {name}_old")
+    cur.execute(f"ALTER TABLE {staging} RENAME TO {name}")
+    for sequence, column in sequences:
+        cur.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.{column}")
+    cur.execute(f"DROP TABLE {schema}.{name}_old CASCADE")
+    for index_name, _, _ in indexes:
+        cur.execute(f"ALTER INDEX {schema}.{index_name}_staging RENAME TO {index_name}")
+    for view, relkind, view_def, view_indexes in views:
+        kind = 'MATERIALIZED VIEW' if relkind == 'm' else 'VIEW'
+        cur.execute(f"CREATE {kind} {view} AS {view_def}")
+        for _, index_def, _ in view_indexes:
+            cur.execute(index_def)
+
+def record_etl_run(cur, source, rows):
+    """
+    Record a successful load in spx.etl_runs.
+
+    Call it in the same transaction as the load, right before the commit: the
+    API uses the newest run as its data version, so its caches are invalidated
+    exactly when the new rows become visible.
+
+    Args:
+        cur (psycopg2.extensions.cursor): Cursor of the loading transaction.
+        source (str): Name of the loaded data set, e.g. 'prices'.
+        rows (int): Number of rows loaded.
+    """
+    cur.execute("INSERT INTO spx.etl_runs (source, rows) VALUES (%s, %s)", (source, int(rows)))
+
+# Queries building the spx.catalog options of a data set and, for per-ticker
+# data, its spx.coverage rows (ticker, first date, last date, row count)
+CATALOG_QUERIES = {
+    'info': ("""
+        SELECT jsonb_build_object(
+            'symbols', coalesce(jsonb_agg(DISTINCT symbol ORDER BY symbol) FILTER (WHERE symbol IS NOT NULL), '[]'),
+            'sectors', coalesce(jsonb_agg(DISTINCT gics_sector ORDER BY gics_sector)
+                                FILTER (WHERE gics_sector IS NOT NULL), '[]'),
+            'subIndustries', coalesce(jsonb_agg(DISTINCT gics_sub_industry ORDER BY gics_sub_industry)
+                                      FILTER (WHERE gics_sub_industry IS NOT NULL), '[]'),
+            'locations', coalesce(jsonb_agg(DISTINCT headquarters_location ORDER BY headquarters_location)
+                                  FILTER (WHERE headquarters_location IS NOT NULL), '[]'),
+            'founded_range', jsonb_build_object('min', min(founded), 'max', max(founded)))
+        FROM spx.info""", None),
+    'prices': ("""
+        SELECT jsonb_build_object(
+            'metrics', '["Close", "High", "Low", "Open", "Volume"]'::jsonb,
+            'date_range', jsonb_build_object('min', min(date), 'max', max(date)))
+        FROM spx.prices_wide""", """
+        SELECT ticker, min(date), max(date), count(*)
+        FROM spx.prices_wide
+        GROUP BY ticker"""),
+    'financials': ("""
+        SELECT jsonb_build_object(
+            'variables', coalesce(jsonb_agg(DISTINCT variable ORDER BY variable) FILTER (WHERE variable IS NOT NULL), '[]'),
+            'date_range', jsonb_build_object('min', min(date), 'max', max(date)))
+        FROM spx.financials""", """
+        SELECT ticker, min(date), max(date), count(*)
+        FROM spx.financials
+        GROUP BY ticker"""),
+    'indicators': ("""
+        SELECT jsonb_build_object(
+            'date_range', jsonb_build_object('min', min(date), 'max', max(date)))
+        FROM spx.indicators""", """
+        SELECT ticker, min(date), max(date), count(*)
+        FROM spx.indicators
+        GROUP BY ticker"""),
+}
+
+def refresh_catalog(cur, source):
+    """
+    Rebuild the spx.catalog entry and spx.coverage rows of a data set.
+
+    The catalog holds the distinct values and date ranges the API offers as
+    filter options, so the filter_options endpoints read one small row instead
+    of scanning the data tables on every request. Call it in the loading
+    transaction after the data has been replaced.
+
+    Args:
+        cur (psycopg2.extensions.cursor): Cursor of the loading transaction.
+        source (str): Data set to catalog, one of CATALOG_QUERIES ('info', 'prices', 'financials', 'indicators').
+    """
+    options_query, coverage_query = CATALOG_QUERIES[source]
+    cur.execute(f"INSERT INTO spx.catalog (source, options, updated_at) "
+                f"VALUES (%s, ({options_query}), clock_timestamp()) "
+                f"ON CONFLICT (source) DO UPDATE SET options = EXCLUDED.options, updated_at = EXCLUDED.updated_at",
+                (source,))
+    if coverage_query:
+        cur.execute("DELETE FROM spx.coverage WHERE source = %s", (source,))
+        cur.execute(f"INSERT INTO spx.coverage (source, ticker, first_date, last_date, rows) "
+                    f"SELECT %s, * FROM ({coverage_query}) AS coverage", (source,))
@@ -0,0 +1,3 @@
+#!/bin/bash
+
+docker build -t spx_05_export_snapshot .
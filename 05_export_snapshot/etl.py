@@ -0,0 +1,63 @@
+import io
+import os
+import pandas as pd
+import psycopg2
+from snapshot import read_manifest, write_snapshot
+
+host = os.getenv('HOST')
+port = os.getenv('PORT')
+user = os.getenv('USER')
+password = os.getenv('PGPASSWORD')
+database = os.getenv('DATABASE')
+
+# Directory shared with the Streamlit dashboard (DATA_BACKEND=duckdb)
+snapshot_dir = os.getenv('SNAPSHOT_DIR', '/snapshot')
+# Rows per Parquet row group, smaller groups let readers skip more rows of unselected tickers
+row_group_size = int(os.getenv('SNAPSHOT_ROW_GROUP_SIZE', '50000'))
+# Number of snapshot versions kept on disk
+keep = int(os.getenv('SNAPSHOT_KEEP', '3'))
+
+# Tables read by the dashboard: query, column types and date columns. Rows are
+# sorted by ticker so the row group statistics of ticker filters are selective.
+SNAPSHOT_TABLES = {
+    'info': ("SELECT symbol, security, gics_sector, gics_sub_industry, headquarters_location, "
+             "date_added, cik, founded FROM spx.info ORDER BY symbol",
+             {'cik': 'Int64', 'founded': str}, ['date_added']),
+    'prices_wide': ("SELECT date, ticker, open, high, low, close, volume FROM spx.prices_wide "
+                    "ORDER BY ticker, date",
+                    None, ['date']),
+    'financials': ("SELECT ticker, date, variable, value FROM spx.financials ORDER BY ticker, date",
+                   None, ['date']),
+}
+
+def read_table(cur, query, dtype=None, parse_dates=None):
+    """Read the result of a query into a DataFrame with COPY TO STDOUT."""
+    buffer = io.StringIO()
+    cur.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER)", buffer)
+    buffer.seek(0)
+    return pd.read_csv(buffer, dtype=dtype, parse_dates=parse_dates)
+
+try:
+    conn = psycopg2.connect(host=host, port=port, user=user, password=password, dbname=database)
+    # All tables and the data version are read from the same database snapshot
+    conn.set_session(isolation_level='REPEATABLE READ', readonly=True)
+    cur = conn.cursor()
+
+    cur.execute("SELECT coalesce(max(id), 0) FROM spx.etl_runs")
+    version = cur.fetchone()[0]
+
+    manifest = read_manifest(snapshot_dir)
+    if manifest is not None and manifest['version'] == version:
+        print(f"Snapshot of data version {version} is up to date")
+    else:
+        tables = {name: read_table(cur, query, dtype, parse_dates)
+                  for name, (query, dtype, parse_dates) in SNAPSHOT_TABLES.items()}
+        manifest = write_snapshot(tables, version, snapshot_dir, row_group_size=row_group_size, keep=keep)
+        print(manifest)
+        print(f"Snapshot of data version {version} written successfully!")
+except Exception as e:
+    print("Error: ", e)
+    exit(1)
+finally:
+    if conn:
+        conn.close()
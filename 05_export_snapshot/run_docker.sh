@@ -0,0 +1,17 @@
+#!/bin/bash
+
+# Path to secrets
+pg_creds_path="pgcreds.json"
+
+# Host directory receiving the Parquet snapshots, mounted read-only by the Streamlit dashboard
+snapshot_dir="${SNAPSHOT_HOST_DIR:-$HOME/spx_snapshot}"
+
+# Load database credentials
+host=$(jq -r '.host' $pg_creds_path)
+port=$(jq -r '.port' $pg_creds_path)
+user=$(jq -r '.user' $pg_creds_path)
+password=$(jq -r '.password' $pg_creds_path)
+database=$(jq -r '.database' $pg_creds_path)
+
+# Run docker image with environment variables
+docker run -e HOST=$host -e PORT=$port -e USER=$user -e PGPASSWORD=$password -e DATABASE=$database -v $snapshot_dir:/snapshot --network host spx_05_export_snapshot
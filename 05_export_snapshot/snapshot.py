@@ -0,0 +1,77 @@
+import json
+import os
+import re
+import shutil
+from datetime import datetime, timezone
+
+MANIFEST_NAME = 'manifest.json'
+
+# Snapshot directories are named after the data version they hold, e.g. v1234
+_VERSION_DIR = re.compile(r'^v(\d+)$')
+
+def snapshot_dir_name(version):
+    """Return the name of the directory holding the snapshot of a data version."""
+    return f'v{version}'
+
+def read_manifest(snapshot_dir):
+    """Return the manifest of the current snapshot, or None if no snapshot was written yet."""
+    try:
+        with open(os.path.join(snapshot_dir, MANIFEST_NAME)) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+def write_snapshot(tables, version, snapshot_dir, row_group_size=50000, keep=3):
+    """
+    Write DataFrames as a Parquet snapshot of a data version and publish it.
+
+    Every table is written to <snapshot_dir>/v<version>/<name>.parquet, first
+    into a temporary directory that is renamed once all files are complete.
+    manifest.json is then replaced atomically, so readers either see the
+    previous snapshot or the new one, never a partial one. Rows should be
+    sorted by the columns readers filter on (e.g. ticker), which gives every
+    row group narrow min/max statistics that a Parquet reader uses to skip it.
+
+    Args:
+        tables (dict): Table name -> DataFrame.
+        version (int): Data version (newest spx.etl_runs id) the tables were read at.
+        snapshot_dir (str): Directory holding the snapshots and the manifest.
+        row_group_size (int, optional): Rows per Parquet row group. Defaults to 50000.
+        keep (int, optional): Number of snapshots kept, older ones are deleted.
+            Readers still on the previous version keep working. Defaults to 3.
+
+    Returns:
+        dict: The published manifest.
+    """
+    name = snapshot_dir_name(version)
+    target = os.path.join(snapshot_dir, name)
+    staging = os.path.join(snapshot_dir, f'.{name}.tmp')
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+
+    for table, df in tables.items():
+        df.to_parquet(os.path.join(staging, f'{table}.parquet'), engine='pyarrow',
+                      compression='zstd', index=False, row_group_size=row_group_size)
+
+    shutil.rmtree(target, ignore_errors=True)
+    os.rename(staging, target)
+
+    manifest = {
+        'version': version,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'tables': {table: f'{name}/{table}.parquet' for table in tables},
+        'rows': {table: len(df) for table, df in tables.items()},
+    }
+    manifest_path = os.path.join(snapshot_dir, MANIFEST_NAME)
+    with open(f'{manifest_path}.tmp', 'w') as file:
+        json.dump(manifest, file, indent=2)
+    os.replace(f'{manifest_path}.tmp', manifest_path)
+
+    prune_snapshots(snapshot_dir, keep)
+    return manifest
+
+def prune_snapshots(snapshot_dir, keep):
+    """Delete all but the keep newest snapshot directories."""
+    versions = sorted(int(match.group(1)) for match in map(_VERSION_DIR.match, os.listdir(snapshot_dir)) if match)
+    for version in versions[:max(len(versions) - keep, 0)]:
+        shutil.rmtree(os.path.join(snapshot_dir, snapshot_dir_name(version)), ignore_errors=True)
@@ -3,7 +3,84 @@ import yfinance as yf
 from datetime import datetime, timedelta
 from tqdm import tqdm
 
-def fetch_stock_prices_gdrive(symbols, start_date=None, end_date=None):
+def _select_ticker(df_batch, ticker):
+    """
+    Extract the OHLCV frame of a single ticker from a yf.download result.
+
+    Multi-ticker downloads (group_by='ticker') return columns indexed by
+    (Ticker, Price); single-ticker downloads may return plain Price columns.
+    Rows where every value is missing (dates only traded by other tickers in
+    the batch, or a failed download) are dropped.
+    """
+    if isinstance(df_batch.columns, pd.MultiIndex):
+        if ticker not in df_batch.columns.get_level_values(0):
+            return pd.DataFrame()
+        df_temp = df_batch[ticker].copy()
+    else:
+        df_temp = df_batch.copy()
+    return df_temp.dropna(how='all')
+
+def _melt_prices(df_temp, ticker):
+    """Melt a single ticker's OHLCV frame into Date/Ticker/Metric/Value rows."""
+    # Convert the index before melting so the melted rows of a bar share one date object
+    df_temp.index = pd.Index(pd.to_datetime(df_temp.index).date, name='Date')
+    df_temp['Ticker'] = ticker
+    return pd.melt(df_temp.reset_index(),
+                   id_vars=['Date', 'Ticker'],
+                   var_name='Metric',
+                   value_name='Value')
+
+def iter_stock_prices_gdrive(symbols, start_date=None, end_date=None, batch_size=50):
+    """
+    Yield stock prices from Yahoo Finance one ticker at a time.
+
+    Takes the same arguments as fetch_stock_prices_gdrive and yields one
+    Date/Ticker/Metric/Value DataFrame per ticker.
+    """
+    if end_date is None:
+        end_date = datetime.now() - timedelta(days=1)
+    if start_date is None:
+        start_date = end_date - timedelta(days=100)
+
+    batches = [symbols[i:i + batch_size] for i in range(0, len(symbols), batch_size)]
+
+    for batch in tqdm(batches, desc="Fetching stock data"):
+        frames = {}
+        try:
+            df_batch = yf.download(batch,
+                                   start=start_date.strftime('%Y-%m-%d'),
+                                   end=end_date.strftime('%Y-%m-%d'),
+                                   auto_adjust=True,
+                                   group_by='ticker',
+                                   progress=False)
+            for ticker in batch:
+                df_temp = _select_ticker(df_batch, ticker)
+                if not df_temp.empty:
+                    frames[ticker] = df_temp
+        except Exception as e:
+            print(f"Error fetching batch starting with {batch[0]}: {e}")
+
+        # Retry the tickers that failed within a multi-ticker batch one at a time
+        failed = [ticker for ticker in batch if ticker not in frames] if len(batch) > 1 else []
+        for ticker in failed:
+            try:
+                df_temp = yf.download(ticker,
+                                      start=start_date.strftime('%Y-%m-%d'),
+                                      end=end_date.strftime('%Y-%m-%d'),
+                                      auto_adjust=True,
+                                      group_by='ticker',
+                                      progress=False)
+                df_temp = _select_ticker(df_temp, ticker)
+                if not df_temp.empty:
+                    frames[ticker] = df_temp
+            except Exception as e:
+                print(f"Error fetching data for {ticker}: {e}")
+
+        for ticker in batch:
+            if ticker in frames:
+                yield _melt_prices(frames[ticker], ticker)
+
+def fetch_stock_prices_gdrive(symbols, start_date=None, end_date=None, batch_size=50):
     """
     Fetch stock prices for given symbols from Yahoo Finance.
 
@@ -11,6 +88,8 @@ def fetch_stock_prices_gdrive(symbols, start_date=None, end_date=None):
         symbols (list): List of stock symbols to fetch data for.
         start_date (datetime, optional): Start date for data fetching. Defaults to 100 days ago.
         end_date (datetime, optional): End date for data fetching. Defaults to yesterday.
+        batch_size (int, optional): Number of symbols requested per yf.download call.
+            Symbols that fail within a batch are retried individually. Defaults to 50.
 
     Returns:
         pandas.DataFrame: A DataFrame containing the fetched stock price data with columns:
@@ -22,28 +101,9 @@ def fetch_stock_prices_gdrive(symbols, start_date=None, end_date=None):
     Raises:
         Exception: If there's an error in fetching or processing the data
     """
-    if end_date is None:
-        end_date = datetime.now() - timedelta(days=1)
-    if start_date is None:
-        start_date = end_date - timedelta(days=100)
-
-    df_prices = pd.DataFrame()
-
-    for ticker in tqdm(symbols, desc="Fetching stock data"):
-        try:
-            df_temp = yf.download(ticker,
-                                  start=start_date.strftime('%Y-%m-%d'),
-                                  end=end_date.strftime('%Y-%m-%d'),
-                                  auto_adjust=True)
-            df_temp['Ticker'] = ticker
-            df_melt = pd.melt(df_temp.reset_index(),
-                              id_vars=['Date', 'Ticker'],
-                              var_name='Metric',
-                              value_name='Value')
-            df_prices = pd.concat([df_prices, df_melt], ignore_index=True)
-        except Exception as e:
-            print(f"Error fetching data for {ticker}: {e}")
-
-    df_prices['Date'] = pd.to_datetime(df_prices['Date']).dt.date
+    frames = list(iter_stock_prices_gdrive(symbols, start_date, end_date, batch_size))
+    if not frames:
+        return pd.DataFrame(columns=['Date', 'Ticker', 'Metric', 'Value'])
 
-    return df_prices
+    # Concatenate once instead of re-copying the accumulated frame per ticker
+    return pd.concat(frames, ignore_index=True)
@@ -2,6 +2,25 @@ import pandas as pd
 import yfinance as yf
 from tqdm import tqdm
 
+def iter_quarterly_financials_gdrive(symbols_list):
+    """
+    Yield quarterly financial data from Yahoo Finance one ticker at a time.
+
+    Takes the same arguments as fetch_quarterly_financials_gdrive and yields one
+    ticker/Date/Metric/Value DataFrame per ticker.
+    """
+    for ticker in tqdm(symbols_list, desc="Fetching financial data"):
+        try:
+            stock = yf.Ticker(ticker)
+            df_temp = stock.quarterly_financials.transpose().reset_index()
+            df_temp['ticker'] = ticker
+            df_melt = pd.melt(df_temp, id_vars=['ticker', 'index'], var_name='Metric', value_name='Value')
+            df_melt = df_melt.rename(columns={'index': 'Date'})
+            df_melt['Date'] = pd.to_datetime(df_melt['Date']).dt.strftime('%Y-%m-%d')
+            yield df_melt
+        except Exception as e:
+            print(f"Error downloading data for {ticker}: {e}")
+
 def fetch_quarterly_financials_gdrive(symbols_list):
     """
     Fetch quarterly financial data for given symbols from Yahoo Finance.
@@ -20,18 +39,9 @@ def fetch_quarterly_financials_gdrive(symbols_list):
     Raises:
         Exception: If there's an error in fetching or processing the data
     """
-    df_fundamentals = pd.DataFrame()
-    for ticker in tqdm(symbols_list, desc="Fetching financial data"):
-        try:
-            stock = yf.Ticker(ticker)
-            df_temp = stock.quarterly_financials.transpose().reset_index()
-            df_temp['ticker'] = ticker
-            df_melt = pd.melt(df_temp, id_vars=['ticker', 'index'], var_name='Metric', value_name='Value')
-            df_fundamentals = pd.concat([df_fundamentals, df_melt], ignore_index=True)
-        except Exception as e:
-            print(f"Error downloading data for {ticker}: {e}")
-    
-    df_fundamentals = df_fundamentals.rename(columns={'index': 'Date'})
-    df_fundamentals['Date'] = pd.to_datetime(df_fundamentals['Date']).dt.strftime('%Y-%m-%d')
-    
-    return df_fundamentals
+    frames = list(iter_quarterly_financials_gdrive(symbols_list))
+    if not frames:
+        return pd.DataFrame(columns=['ticker', 'Date', 'Metric', 'Value'])
+
+    # Concatenate once instead of re-copying the accumulated frame per ticker
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,70 @@
+"""
+Benchmark COPY FROM STDIN against execute_values for loading price rows.
+
+Loads the same synthetic Date/Ticker/Metric/Value frame into a temporary table
+shaped like spx.prices with both loader functions of 02_source_prices and
+reports the rows per second of each. Requires a PostgreSQL connection
+configured through the same environment variables as the ETLs (HOST, PORT,
+USER, PGPASSWORD, DATABASE); nothing is written to the spx schema.
+
+Usage:
+    python benchmarks/bench_bulk_load.py --rows 1000000
+"""
+import argparse
+import importlib
+import os
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import psycopg2
+
+project_root = Path(__file__).parents[1]
+sys.path.append(str(project_root))
+
+loader = importlib.import_module("02_source_prices.loader")
+
+
+def synthetic_prices(n_rows):
+    """Return n_rows of long-format prices with the column order of spx.prices."""
+    metrics = ['Open', 'High', 'Low', 'Close', 'Volume']
+    n_bars = -(-n_rows // len(metrics))
+    dates = [date(2014, 1, 1) + timedelta(days=i % 3650) for i in range(n_bars)]
+    tickers = [f"T{i // 3650:03d}" for i in range(n_bars)]
+    return pd.DataFrame({
+        'Date': np.repeat(dates, len(metrics))[:n_rows],
+        'Ticker': np.repeat(tickers, len(metrics))[:n_rows],
+        'Metric': np.tile(metrics, n_bars)[:n_rows],
+        'Value': np.random.default_rng(0).uniform(10, 500, n_rows),
+    })
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1000000)
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(host=os.getenv('HOST'), port=os.getenv('PORT'), user=os.getenv('USER'),
+                            password=os.getenv('PGPASSWORD'), dbname=os.getenv('DATABASE'))
+    cur = conn.cursor()
+    cur.execute("CREATE TEMP TABLE bench_prices (date date, ticker varchar(255), "
+                "metric varchar(255), value float)")
+
+    df = synthetic_prices(args.rows)
+    results = []
+    for name, load in [('execute_values', loader.insert_dataframe), ('copy', loader.copy_dataframe)]:
+        cur.execute("TRUNCATE bench_prices")
+        started = time.perf_counter()
+        load(cur, df, 'bench_prices')
+        conn.commit()
+        elapsed = time.perf_counter() - started
+        cur.execute("SELECT count(*) FROM bench_prices")
+        results.append((name, cur.fetchone()[0], elapsed))
+    conn.close()
+
+    print(f"{'method':<16}{'rows':>10}{'wall time (s)':>16}{'rows/s':>12}")
+    for name, rows, elapsed in results:
+        print(f"{name:<16}{rows:>10}{elapsed:>16.2f}{rows / elapsed:>12.0f}")
@@ -0,0 +1,113 @@
+"""
+Benchmark the per-ticker pd.concat accumulation in the price fetcher.
+
+Compares the legacy pattern (growing df_prices with pd.concat on every ticker)
+against the generator based fetch_stock_prices, which concatenates once, and
+against consuming iter_stock_prices directly the way a streaming loader does.
+All strategies consume the same synthetic yf.download frames, one ticker per
+call, so the only difference measured is how the per-ticker frames are accumulated.
+Each strategy runs in a fresh process so peak RSS is not shared between them.
+
+Usage:
+    python benchmarks/bench_fetcher_concat.py --tickers 500 --years 10
+"""
+import argparse
+import functools
+import importlib
+import multiprocessing
+import resource
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).parents[1]
+sys.path.append(str(project_root))
+
+
+@functools.lru_cache(maxsize=None)
+def _synthetic_frame(start, end):
+    index = pd.bdate_range(start, end, inclusive='left', name='Date')
+    close = np.random.default_rng(len(index)).uniform(10, 500, len(index))
+    return pd.DataFrame({'Open': close, 'High': close * 1.01, 'Low': close * 0.99,
+                         'Close': close, 'Volume': np.full(len(index), 1e6)}, index=index)
+
+
+def synthetic_download(tickers, start=None, end=None, **kwargs):
+    """Return a deterministic OHLCV frame shaped like yf.download for one ticker."""
+    return _synthetic_frame(start, end).copy()
+
+
+def accumulate(symbols, start_date, end_date):
+    """Legacy pattern: re-copy the accumulated frame for every ticker."""
+    df_prices = pd.DataFrame()
+    for ticker in symbols:
+        df_temp = synthetic_download(ticker,
+                                     start=start_date.strftime('%Y-%m-%d'),
+                                     end=end_date.strftime('%Y-%m-%d'))
+        df_temp['Ticker'] = ticker
+        df_melt = pd.melt(df_temp.reset_index(),
+                          id_vars=['Date', 'Ticker'],
+                          var_name='Metric',
+                          value_name='Value')
+        df_prices = pd.concat([df_prices, df_melt], ignore_index=True)
+    df_prices['Date'] = pd.to_datetime(df_prices['Date']).dt.date
+    return df_prices
+
+
+def _data_fetcher():
+    data_fetcher = importlib.import_module("02_source_prices.data_fetcher")
+    data_fetcher.yf.download = synthetic_download
+    return data_fetcher
+
+
+def generator(symbols, start_date, end_date):
+    """Current pattern: fetch_stock_prices concatenates the yielded frames once."""
+    return _data_fetcher().fetch_stock_prices(symbols, start_date, end_date, batch_size=1)
+
+
+def stream(symbols, start_date, end_date):
+    """Streaming pattern: each yielded frame is handed to the loader and dropped."""
+    rows = 0
+    for df_melt in _data_fetcher().iter_stock_prices(symbols, start_date, end_date, batch_size=1):
+        rows += len(df_melt)
+    return rows
+
+
+def run(strategy, n_tickers, years, queue):
+    end_date = datetime(2024, 1, 1)
+    start_date = end_date - timedelta(days=years * 365)
+    symbols = [f"T{i:03d}" for i in range(n_tickers)]
+
+    started = time.perf_counter()
+    result = globals()[strategy](symbols, start_date, end_date)
+    elapsed = time.perf_counter() - started
+    rows = result if isinstance(result, int) else len(result)
+
+    # ru_maxrss is reported in kilobytes on Linux
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    queue.put((strategy, rows, elapsed, peak_rss_mb))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--tickers', type=int, default=500)
+    parser.add_argument('--years', type=int, default=10)
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context('spawn')
+    queue = ctx.Queue()
+    results = []
+    for strategy in ['accumulate', 'generator', 'stream']:
+        process = ctx.Process(target=run, args=(strategy, args.tickers, args.years, queue))
+        process.start()
+        results.append(queue.get())
+        process.join()
+
+    print(f"{args.tickers} tickers x {args.years} years")
+    print(f"{'strategy':<12}{'rows':>12}{'wall time (s)':>16}{'peak RSS (MB)':>16}")
+    for strategy, rows, elapsed, peak_rss_mb in results:
+        print(f"{strategy:<12}{rows:>12}{elapsed:>16.2f}{peak_rss_mb:>16.1f}")
@@ -4,6 +4,7 @@ CREATE SCHEMA IF NOT EXISTS spx;
 -- create table info
 CREATE TABLE spx.info
 (
+  id bigserial PRIMARY KEY,
   symbol varchar(255),
   security varchar(255),
   gics_sector varchar(255),
@@ -17,21 +18,47 @@ CREATE TABLE spx.info
 -- create index for table info
 CREATE INDEX IX_info ON spx.info (symbol);
 
--- create table prices
-CREATE TABLE spx.prices 
+-- create table prices_wide (one row per ticker and day), range partitioned by date
+CREATE TABLE spx.prices_wide
 (
+  id bigserial,
   date date,
   ticker varchar(255),
-  metric varchar(255),
-  value float
-);
+  open float,
+  high float,
+  low float,
+  close float,
+  volume float
+) PARTITION BY RANGE (date);
 
--- create index for table prices
-CREATE INDEX IX_prices ON spx.prices (ticker, metric, date);
+-- create unique index for table prices_wide (also the conflict target for incremental upserts)
+CREATE UNIQUE INDEX IX_prices_wide ON spx.prices_wide (ticker, date);
+
+-- yearly partitions spx.prices_wide_<year> are created (and dropped past the retention window) by the prices ETL
+
+-- create view prices_view (long date/ticker/metric/value layout over prices_wide)
+-- the id is derived from the stored prices_wide id so filters on ticker/date reach its indexes
+CREATE OR REPLACE VIEW spx.prices_view AS
+SELECT
+    p.id * 5 + m.ordinal AS id,
+    p.date,
+    p.ticker,
+    m.metric::varchar(255) AS metric,
+    m.value
+FROM spx.prices_wide p
+CROSS JOIN LATERAL (
+    VALUES (0, 'Open', p.open), (1, 'High', p.high), (2, 'Low', p.low), (3, 'Close', p.close), (4, 'Volume', p.volume)
+) AS m (ordinal, metric, value);
+
+-- create view prices (long layout without ids)
+CREATE OR REPLACE VIEW spx.prices AS
+SELECT date, ticker, metric, value
+FROM spx.prices_view;
 
 -- create table financials
-CREATE TABLE spx.financials 
+CREATE TABLE spx.financials
 (
+  id bigserial PRIMARY KEY,
   ticker varchar(255),
   date date,
   variable varchar(255),
@@ -41,37 +68,86 @@ CREATE TABLE spx.financials
 -- create index for table financials
 CREATE INDEX IX_financials ON spx.financials (ticker, date);
 
--- Create views with IDs for Django
--- Info view with ID
-CREATE OR REPLACE VIEW spx.info_view AS
-SELECT 
-    ROW_NUMBER() OVER (ORDER BY symbol) as id,
-    symbol,
-    security,
-    gics_sector,
-    gics_sub_industry,
-    headquarters_location,
-    date_added,
-    cik,
-    founded
-FROM spx.info;
-
--- Prices view with ID
-CREATE OR REPLACE VIEW spx.prices_view AS
-SELECT 
-    ROW_NUMBER() OVER (ORDER BY date, ticker, metric) as id,
-    date,
-    ticker,
-    metric,
-    value
-FROM spx.prices;
-
--- Financials view with ID
-CREATE OR REPLACE VIEW spx.financials_view AS
-SELECT 
-    ROW_NUMBER() OVER (ORDER BY ticker, date, variable) as id,
-    ticker,
-    date,
-    variable,
-    value
-FROM spx.financials;
+-- create table etl_runs (one row per successful load, the newest id is the data version of the API caches)
+CREATE TABLE spx.etl_runs
+(
+  id bigserial PRIMARY KEY,
+  source varchar(255),
+  rows bigint,
+  finished_at timestamptz DEFAULT clock_timestamp()
+);
+
+-- create table indicators (technical indicators per ticker and day, computed from prices_wide by 04_compute_indicators)
+CREATE TABLE spx.indicators
+(
+  id bigserial PRIMARY KEY,
+  date date,
+  ticker varchar(255),
+  log_return float,
+  sma_20 float,
+  sma_50 float,
+  sma_200 float,
+  ema_12 float,
+  ema_26 float,
+  volatility_20 float,
+  rsi_14 float,
+  drawdown float
+);
+
+-- create unique index for table indicators
+CREATE UNIQUE INDEX IX_indicators ON spx.indicators (ticker, date);
+
+-- create table catalog (filter options of each data set, rebuilt by its ETL)
+CREATE TABLE spx.catalog
+(
+  source varchar(255) PRIMARY KEY,
+  options jsonb,
+  updated_at timestamptz
+);
+
+-- create table coverage (first and last date and row count per ticker and data set, rebuilt by the ETLs)
+CREATE TABLE spx.coverage
+(
+  id bigserial PRIMARY KEY,
+  source varchar(255),
+  ticker varchar(255),
+  first_date date,
+  last_date date,
+  rows bigint
+);
+
+-- create index for table coverage
+CREATE INDEX IX_coverage ON spx.coverage (source, ticker);
+
+-- create materialized view ticker_summary (one row per ticker, refreshed by the prices ETL after each load)
+CREATE MATERIALIZED VIEW spx.ticker_summary AS
+SELECT
+  s.ticker,
+  s.first_date,
+  s.last_date,
+  s.trading_days,
+  s.latest_close,
+  s.previous_close,
+  s.latest_close / NULLIF(s.previous_close, 0) - 1 AS daily_return,
+  s.high_52w,
+  s.low_52w,
+  s.latest_close / NULLIF(s.prior_year_close, 0) - 1 AS ytd_return
+FROM (
+  SELECT
+    p.ticker,
+    min(p.date) AS first_date,
+    max(p.date) AS last_date,
+    count(*) AS trading_days,
+    (array_agg(p.close ORDER BY p.date DESC) FILTER (WHERE p.close IS NOT NULL))[1] AS latest_close,
+    (array_agg(p.close ORDER BY p.date DESC) FILTER (WHERE p.close IS NOT NULL))[2] AS previous_close,
+    max(p.high) FILTER (WHERE p.date > l.last_date - interval '52 weeks') AS high_52w,
+    min(p.low) FILTER (WHERE p.date > l.last_date - interval '52 weeks') AS low_52w,
+    (array_agg(p.close ORDER BY p.date DESC)
+      FILTER (WHERE p.close IS NOT NULL AND p.date < date_trunc('year', l.last_date)))[1] AS prior_year_close
+  FROM spx.prices_wide AS p
+  JOIN (SELECT ticker, max(date) AS last_date FROM spx.prices_wide GROUP BY ticker) AS l ON l.ticker = p.ticker
+  GROUP BY p.ticker
+) AS s;
+
+-- create unique index for materialized view ticker_summary (required by REFRESH ... CONCURRENTLY)
+CREATE UNIQUE INDEX IX_ticker_summary ON spx.ticker_summary (ticker);
@@ -29,9 +29,15 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # orjson based JSON, NaN/Inf are rendered as null
+    'DEFAULT_RENDERER_CLASSES': [
+        'spx.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
 }
 
 MIDDLEWARE = [
+    'spx.health.HealthCheckMiddleware',  # /healthz and /readyz, must stay first
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -70,9 +76,24 @@ DATABASES = {
         'PASSWORD': os.getenv('PGPASSWORD', ''),
         'HOST': os.getenv('HOST', 'localhost'),
         'PORT': os.getenv('PORT', '5432'),
+        # Keep connections open between requests instead of reconnecting every time,
+        # and check them before reuse so a restarted database does not fail a request
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# Async list views for prices and financials (spx/async_views.py), for ASGI deployments only.
+# They read through a psycopg connection pool per worker instead of Django's connection.
+ASYNC_VIEWS = os.getenv('DJANGO_ASYNC_VIEWS', 'False') == 'True'
+ASYNC_DB_POOL_MIN_SIZE = int(os.getenv('ASYNC_DB_POOL_MIN_SIZE', '1'))
+ASYNC_DB_POOL_MAX_SIZE = int(os.getenv('ASYNC_DB_POOL_MAX_SIZE', '10'))
+
+# Under ASGI every request runs its sync code in a new thread context, whose persistent
+# connections are neither reused nor reliably closed, so they are turned off (see the Django docs)
+if ASYNC_VIEWS:
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
 USE_I18N = True
@@ -80,6 +101,28 @@ USE_TZ = True
 STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Response cache for the API (see spx/caching.py), shared between workers through Redis when
+# REDIS_URL is set. Entries are keyed by the ETL data version, the timeout only frees memory.
+API_CACHE_TIMEOUT = int(os.getenv('API_CACHE_TIMEOUT', '86400'))
+# Larger responses (e.g. unfiltered price lists) are not cached, they would fill the worker memory or Redis
+API_CACHE_MAX_ROWS = int(os.getenv('API_CACHE_MAX_ROWS', '50000'))
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+            'TIMEOUT': API_CACHE_TIMEOUT,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'TIMEOUT': API_CACHE_TIMEOUT,
+            'OPTIONS': {'MAX_ENTRIES': 1000},
+        }
+    }
+
 # CORS settings
 CORS_ALLOW_ALL_ORIGINS = True
 
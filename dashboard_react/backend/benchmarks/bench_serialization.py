@@ -0,0 +1,83 @@
+"""
+Benchmark the serialization of bulk price and financial payloads.
+
+Compares the ModelSerializer path (model instances built the way the ORM
+does, PricesSerializer/FinancialsSerializer and DRF's JSONRenderer) against
+the fast path used by the list endpoints (values() dicts encoded by
+FastJSONRenderer) on the same synthetic rows, and reports rows per second of
+each. 1% of the financial values are NaN/Inf to exercise the null handling.
+No database connection is needed.
+
+Usage:
+    python benchmarks/bench_serialization.py --rows 1000000
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import django
+
+backend_root = Path(__file__).parents[1]
+sys.path.append(str(backend_root))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'api.settings')
+os.environ.setdefault('DJANGO_SECRET_KEY', 'benchmark')
+django.setup()
+
+from rest_framework.renderers import JSONRenderer
+
+from spx.models import Prices, Financials
+from spx.renderers import FastJSONRenderer, orjson
+from spx.serializers import PricesSerializer, FinancialsSerializer
+
+
+def synthetic_rows(n_rows, financials=False):
+    """Return n_rows tuples shaped like the prices_view (or financials) columns."""
+    start = date(2014, 1, 1)
+    if financials:
+        variables = ['Total Revenue', 'Net Income', 'EBITDA', 'Basic EPS']
+        special = [float('nan'), float('inf')]
+        return [(i, f"T{i % 500:03d}", start + timedelta(days=i % 3650), variables[i % 4],
+                 special[i % 2] if i % 100 == 0 else i * 0.5)
+                for i in range(n_rows)]
+    metrics = ['Open', 'High', 'Low', 'Close', 'Volume']
+    return [(i, start + timedelta(days=i % 3650), f"T{i % 500:03d}", metrics[i % 5], i * 0.5)
+            for i in range(n_rows)]
+
+
+def serializer_path(model, serializer_class, rows):
+    """Before: ORM model instances, ModelSerializer(many=True) and JSONRenderer."""
+    field_names = [field.attname for field in model._meta.concrete_fields]
+    objects = [model.from_db('default', field_names, row) for row in rows]
+    return JSONRenderer().render(serializer_class(objects, many=True).data)
+
+
+def fast_path(model, serializer_class, rows):
+    """After: values() dicts rendered by FastJSONRenderer."""
+    field_names = [field.attname for field in model._meta.concrete_fields]
+    fields = serializer_class.Meta.fields
+    dicts = [{name: value for name, value in zip(field_names, row) if name in fields} for row in rows]
+    return FastJSONRenderer().render(dicts)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1000000)
+    args = parser.parse_args()
+
+    results = []
+    for name, model, serializer_class, financials in [('prices', Prices, PricesSerializer, False),
+                                                      ('financials', Financials, FinancialsSerializer, True)]:
+        rows = synthetic_rows(args.rows, financials)
+        for path, render in [('serializer', serializer_path), ('fast', fast_path)]:
+            started = time.perf_counter()
+            body = render(model, serializer_class, rows)
+            elapsed = time.perf_counter() - started
+            results.append((name, path, len(body), elapsed))
+
+    print(f"{args.rows} rows, encoder: {'orjson' if orjson is not None else 'json (orjson not installed)'}")
+    print(f"{'payload':<12}{'path':<12}{'MB':>8}{'wall time (s)':>16}{'rows/s':>12}")
+    for name, path, size, elapsed in results:
+        print(f"{name:<12}{path:<12}{size / 1e6:>8.1f}{elapsed:>16.2f}{args.rows / elapsed:>12.0f}")
@@ -0,0 +1,87 @@
+"""
+Load test a running backend with concurrent clients.
+
+Every client thread requests the given API paths round-robin for the given
+duration over its own keep-alive connection, and the script reports requests
+per second and latency percentiles per path. Run it against the development
+server and against gunicorn (see gunicorn.conf.py) on the same local
+PostgreSQL database to compare serving modes, e.g. DB_CONN_MAX_AGE=0 versus
+persistent connections. The token is read from API_TOKEN.
+
+Usage:
+    python benchmarks/bench_serving.py --url http://localhost:8081 --clients 16 --duration 30
+"""
+import argparse
+import http.client
+import os
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+DEFAULT_PATHS = [
+    '/api/info/filter_options/',
+    '/api/info/?symbols[]=AAPL',
+    '/api/prices/?symbols[]=AAPL&metric=Close&date_min=2024-01-01',
+    '/api/prices/resample/?symbols[]=AAPL&max_points=500',
+    '/api/financials/?symbols[]=AAPL',
+]
+
+
+def client(url, paths, headers, deadline, latencies, errors):
+    """Request paths round-robin until the deadline, recording the latency of each response."""
+    parts = urlsplit(url)
+    conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=60)
+    i = 0
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        started = time.perf_counter()
+        try:
+            conn.request('GET', path, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                errors[path] += 1
+                continue
+        except (OSError, http.client.HTTPException):
+            errors[path] += 1
+            conn.close()
+            conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=60)
+            continue
+        latencies[path].append(time.perf_counter() - started)
+    conn.close()
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] if values else float('nan')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--url', default='http://localhost:8081')
+    parser.add_argument('--clients', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=30)
+    parser.add_argument('--paths', nargs='+', default=DEFAULT_PATHS)
+    args = parser.parse_args()
+
+    headers = {'Authorization': f"Token {os.getenv('API_TOKEN', '')}"}
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    deadline = time.perf_counter() + args.duration
+    threads = [threading.Thread(target=client, args=(args.url, args.paths, headers, deadline, latencies, errors))
+               for _ in range(args.clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    total = sum(len(values) for values in latencies.values())
+    print(f"{args.clients} clients, {args.duration:.0f} s: {total / args.duration:.1f} requests/s, "
+          f"{sum(errors.values())} errors")
+    print(f"{'path':<64}{'requests':>10}{'p50 (ms)':>10}{'p95 (ms)':>10}{'errors':>8}")
+    for path in args.paths:
+        values = latencies[path]
+        print(f"{path:<64}{len(values):>10}{percentile(values, 0.5) * 1000:>10.1f}"
+              f"{percentile(values, 0.95) * 1000:>10.1f}{errors[path]:>8}")
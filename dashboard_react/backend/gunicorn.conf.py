@@ -0,0 +1,36 @@
+"""
+Gunicorn configuration of the production server (see Dockerfile).
+
+Every setting can be overridden through the environment, e.g.
+GUNICORN_WORKERS=4 GUNICORN_THREADS=8. Each worker thread keeps its own
+persistent database connection (CONN_MAX_AGE), so the database has to accept
+workers * threads connections per replica.
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('GUNICORN_PORT', '8081')}"
+
+# Processes serve requests in parallel, threads overlap the time spent waiting on PostgreSQL
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv('GUNICORN_THREADS', '4'))
+
+# With DJANGO_ASYNC_VIEWS=True the ASGI application runs on uvicorn workers, whose event loop
+# serves the async price and financial lists concurrently (see spx/async_views.py)
+if os.getenv('DJANGO_ASYNC_VIEWS', 'False') == 'True':
+    wsgi_app = 'api.asgi:application'
+    worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'uvicorn.workers.UvicornWorker')
+else:
+    wsgi_app = 'api.wsgi:application'
+    worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread' if threads > 1 else 'sync')
+
+# Bulk price payloads can take a while to build, restart workers periodically to return memory
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))
+graceful_timeout = 30
+keepalive = 5
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '1000'))
+max_requests_jitter = 100
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
@@ -0,0 +1,50 @@
+import asyncio
+import weakref
+from django.conf import settings
+
+try:
+    from psycopg.conninfo import make_conninfo
+    from psycopg_pool import AsyncConnectionPool
+except ImportError:
+    AsyncConnectionPool = None
+
+# One pool per event loop; an ASGI worker runs a single loop for its whole life
+_pools = weakref.WeakKeyDictionary()
+
+async def _open_pool():
+    db = settings.DATABASES['default']
+    conninfo = make_conninfo(dbname=db['NAME'], user=db['USER'], password=db['PASSWORD'],
+                             host=db['HOST'], port=db['PORT'])
+    pool = AsyncConnectionPool(conninfo, min_size=settings.ASYNC_DB_POOL_MIN_SIZE,
+                               max_size=settings.ASYNC_DB_POOL_MAX_SIZE, open=False)
+    await pool.open()
+    return pool
+
+async def get_pool():
+    """
+    Return the psycopg connection pool of the running event loop, opening it on first use.
+
+    Concurrent first calls share the same opening task, so a worker never
+    opens more than one pool.
+    """
+    loop = asyncio.get_running_loop()
+    task = _pools.get(loop)
+    if task is None:
+        task = _pools[loop] = loop.create_task(_open_pool())
+    return await task
+
+async def fetch_all(sql, params=None):
+    """
+    Run a query on a pooled connection without blocking the event loop.
+
+    Args:
+        sql (str): Query with %s placeholders, e.g. from QuerySet.query.sql_with_params().
+        params (list, optional): Query parameters.
+
+    Returns:
+        list: The result rows as tuples.
+    """
+    pool = await get_pool()
+    async with pool.connection() as conn:
+        cursor = await conn.execute(sql, params)
+        return await cursor.fetchall()
@@ -0,0 +1,105 @@
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.http import HttpResponse
+from rest_framework.exceptions import APIException, ValidationError
+from .async_db import fetch_all
+from .caching import aget_data_version, cache_key, etag_for, is_cacheable, not_modified, set_validators
+from .renderers import dumps
+from .serializers import PricesSerializer, FinancialsSerializer
+from .views import (PRICE_METRICS, PricesViewSet, FinancialsViewSet,
+                    filter_prices, filter_financials, apply_limit)
+
+_MISSING = object()
+
+CATALOG_METRICS_QUERY = "SELECT options -> 'metrics' FROM spx.catalog WHERE source = 'prices'"
+
+# Features served by the synchronous viewsets: pagination, streaming, other formats
+SYNC_ONLY_PARAMS = ('cursor', 'page_size', 'stream', 'format')
+
+_prices_viewset = sync_to_async(PricesViewSet.as_view({'get': 'list'}))
+_financials_viewset = sync_to_async(FinancialsViewSet.as_view({'get': 'list'}))
+
+def _is_plain_json(request):
+    """Return True if the request only needs the plain JSON list the async views produce."""
+    accept = request.headers.get('Accept', '*/*')
+    return (request.method == 'GET'
+            and not any(param in request.GET for param in SYNC_ONLY_PARAMS)
+            and 'text/html' not in accept and 'vnd.' not in accept)
+
+@sync_to_async
+def _is_authorized(request, viewset_class):
+    """
+    Run the viewset's own DRF checks (authentication, permissions, throttling) on the request.
+
+    Requests failing any of them are passed to the viewset, which returns the
+    matching 401/403/429 response.
+    """
+    view = viewset_class(action_map={'get': 'list'}, action='list', args=(), kwargs={}, headers={})
+    view.request = view.initialize_request(request)
+    try:
+        view.initial(view.request)
+    except APIException:
+        return False
+    return True
+
+async def _cached_list(request, build_queryset, fields):
+    """
+    Serve the rows of a queryset as JSON, cached like cached_endpoint and under the same keys.
+
+    build_queryset is only called on a cache miss; the compiled query runs on
+    the async pool, so the event loop keeps serving other requests meanwhile.
+    """
+    version, last_modified = await aget_data_version()
+    key = cache_key(request, version)
+    etag = etag_for(key, 'application/json')
+    if not_modified(request, etag, last_modified):
+        return set_validators(HttpResponse(status=304), etag, last_modified)
+
+    data = await cache.aget(key, _MISSING)
+    if data is _MISSING:
+        try:
+            queryset = await build_queryset()
+        except ValidationError as e:
+            return HttpResponse(dumps(e.detail), status=400, content_type='application/json')
+        sql, params = apply_limit(queryset, request.GET).values(*fields).query.sql_with_params()
+        data = [dict(zip(fields, row)) for row in await fetch_all(sql, list(params))]
+        if is_cacheable(data):
+            await cache.aset(key, data)
+    return set_validators(HttpResponse(dumps(data), content_type='application/json'), etag, last_modified)
+
+async def prices_list(request):
+    """
+    Async GET /api/prices/ for ASGI deployments (DJANGO_ASYNC_VIEWS=True).
+
+    Returns the same rows, cache entries and ETags as PricesViewSet.list, but
+    waits on PostgreSQL without holding a worker thread, so the concurrent
+    requests of a dashboard page load share one event loop. Unauthenticated
+    requests are checked with the viewset's DRF authentication and permission
+    classes; requests failing them and pagination, streaming and other formats
+    are passed to the viewset.
+    """
+    if not _is_plain_json(request) or not await _is_authorized(request, PricesViewSet):
+        return await _prices_viewset(request)
+
+    async def build_queryset():
+        valid_metrics = None
+        if 'metric' in request.GET or 'metrics[]' in request.GET:
+            rows = await fetch_all(CATALOG_METRICS_QUERY)
+            valid_metrics = rows[0][0] if rows and rows[0][0] else PRICE_METRICS
+        return filter_prices(request.GET, valid_metrics)
+
+    return await _cached_list(request, build_queryset, PricesSerializer.Meta.fields)
+
+async def financials_list(request):
+    """Async GET /api/financials/ for ASGI deployments, see prices_list."""
+    if not _is_plain_json(request) or not await _is_authorized(request, FinancialsViewSet):
+        return await _financials_viewset(request)
+
+    async def build_queryset():
+        return filter_financials(request.GET)
+
+    try:
+        return await _cached_list(request, build_queryset, FinancialsSerializer.Meta.fields)
+    except Exception as e:
+        print(f"Error processing financials request: {str(e)}")
+        return HttpResponse(b'[]', content_type='application/json')
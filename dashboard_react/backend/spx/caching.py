@@ -0,0 +1,115 @@
+import hashlib
+from functools import wraps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.utils.http import http_date, parse_http_date_safe, parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+from .async_db import fetch_all
+
+_MISSING = object()
+
+DATA_VERSION_QUERY = ("SELECT id, extract(epoch FROM finished_at)::bigint "
+                      "FROM spx.etl_runs ORDER BY id DESC LIMIT 1")
+
+def get_data_version():
+    """
+    Return the version of the data, bumped by every successful ETL load.
+
+    Each ETL inserts a row into spx.etl_runs in the same transaction as its
+    load, so the newest id changes exactly when new data becomes visible.
+
+    Returns:
+        tuple: (version, last_modified) where version is the newest etl_runs id
+        (0 before the first run) and last_modified the epoch seconds at which
+        that run finished (None before the first run).
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(DATA_VERSION_QUERY)
+        row = cursor.fetchone()
+    return (row[0], row[1]) if row else (0, None)
+
+async def aget_data_version():
+    """Async get_data_version() for the async views, reading through the psycopg pool."""
+    rows = await fetch_all(DATA_VERSION_QUERY)
+    return (rows[0][0], rows[0][1]) if rows else (0, None)
+
+def cache_key(request, version):
+    """Build the cache key of a request from the data version, its path and its normalized query parameters."""
+    query_params = getattr(request, 'query_params', request.GET)
+    params = sorted((key, sorted(values)) for key, values in query_params.lists())
+    digest = hashlib.sha256(f"{request.path}?{params}".encode()).hexdigest()
+    return f"spx:{version}:{digest}"
+
+def etag_for(key, media_type):
+    """Return the ETag of the response cached under key in the given media type."""
+    return quote_etag(hashlib.sha256(f"{key}:{media_type}".encode()).hexdigest()[:32])
+
+def set_validators(response, etag, last_modified):
+    """Set the ETag, Last-Modified and Cache-Control headers of a cacheable response."""
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    # Browsers keep the response but revalidate it, which costs a 304 until the next load
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+def not_modified(request, etag, last_modified):
+    """Return True if the client's cached copy (If-None-Match / If-Modified-Since) is still current."""
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match:
+        etags = parse_etags(if_none_match)
+        return '*' in etags or etag in etags
+    if_modified_since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+    return last_modified is not None and if_modified_since is not None and last_modified <= if_modified_since
+
+def is_cacheable(data):
+    """Return True if response data holds at most API_CACHE_MAX_ROWS rows (or results of a page)."""
+    rows = data.get('results') if isinstance(data, dict) else data
+    return not isinstance(rows, list) or len(rows) <= settings.API_CACHE_MAX_ROWS
+
+def cached_endpoint(view_method):
+    """
+    Cache the response data of a viewset method until the next ETL load.
+
+    The data is cached under the current data version and the normalized
+    query parameters, so entries of older versions are simply never read
+    again and expire. Responses carry an ETag (which also varies with the
+    negotiated format) and a Last-Modified date, and conditional requests
+    get a 304 without running the view. Streaming responses, responses
+    other than 200 and lists longer than API_CACHE_MAX_ROWS are not cached,
+    the latter still get the validators.
+
+    Example:
+        ```python
+        class InfoViewSet(viewsets.ViewSet):
+            @cached_endpoint
+            def list(self, request):
+                ...
+        ```
+    """
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        if request.query_params.get('stream') == 'true':
+            return view_method(self, request, *args, **kwargs)
+
+        version, last_modified = get_data_version()
+        key = cache_key(request, version)
+        etag = etag_for(key, request.accepted_media_type)
+
+        if not_modified(request, etag, last_modified):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            data = cache.get(key, _MISSING)
+            if data is _MISSING:
+                response = view_method(self, request, *args, **kwargs)
+                if not isinstance(response, Response) or response.status_code != status.HTTP_200_OK:
+                    return response
+                if is_cacheable(response.data):
+                    cache.set(key, response.data)
+            else:
+                response = Response(data)
+
+        return set_validators(response, etag, last_modified)
+    return wrapper
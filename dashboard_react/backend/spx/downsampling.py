@@ -0,0 +1,110 @@
+import numpy as np
+from django.db import connection
+
+# date_trunc() field for every supported resampling interval
+INTERVALS = {'week': 'week', 'month': 'month'}
+
+OHLCV_FIELDS = ('date', 'ticker', 'open', 'high', 'low', 'close', 'volume')
+
+def resample_prices(symbols, interval, date_min=None, date_max=None):
+    """
+    Aggregate daily prices into weekly or monthly OHLCV bars in SQL.
+
+    Each bar takes the open of the first day and the close of the last day of
+    its bucket, the highest high, the lowest low and the summed volume. The
+    date of a bar is the first day of its bucket.
+
+    Args:
+        symbols (list): Tickers to aggregate.
+        interval (str): One of INTERVALS ('week' or 'month').
+        date_min (str, optional): First date (inclusive) to aggregate.
+        date_max (str, optional): Last date (inclusive) to aggregate.
+
+    Returns:
+        list: One dict per ticker and bucket with the keys of OHLCV_FIELDS,
+        ordered by ticker and date.
+    """
+    query = f"""
+        SELECT date_trunc('{INTERVALS[interval]}', date)::date AS bucket,
+               ticker,
+               (array_agg(open ORDER BY date))[1],
+               max(high),
+               min(low),
+               (array_agg(close ORDER BY date DESC))[1],
+               sum(volume)
+        FROM spx.prices_wide
+        WHERE ticker = ANY(%s)
+          AND date >= COALESCE(%s::date, '-infinity')
+          AND date <= COALESCE(%s::date, 'infinity')
+        GROUP BY ticker, bucket
+        ORDER BY ticker, bucket
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(query, [list(symbols), date_min, date_max])
+        return [dict(zip(OHLCV_FIELDS, row)) for row in cursor.fetchall()]
+
+def lttb_indices(y, max_points):
+    """
+    Select the indices of at most max_points points with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. The points in between are split
+    into max_points - 2 buckets, and from every bucket the point forming the
+    largest triangle with the previously selected point and the mean of the
+    next bucket is kept, which preserves the visual shape (peaks and troughs)
+    of the series. x is the position in the series, so gaps such as weekends
+    do not affect the selection.
+
+    Args:
+        y (numpy.ndarray): Values of the series, in date order.
+        max_points (int): Maximum number of points to keep (at least 3).
+
+    Returns:
+        numpy.ndarray: Sorted indices of the selected points.
+    """
+    n = len(y)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+
+    y = np.nan_to_num(np.asarray(y, dtype=float))
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    selected = np.empty(max_points, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+
+    previous = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        # Mean of the next bucket, or the last point for the final bucket
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_x = (end + next_end - 1) / 2
+        next_y = y[end:next_end].mean()
+
+        x = np.arange(start, end)
+        areas = np.abs((previous - next_x) * (y[start:end] - y[previous])
+                       - (previous - x) * (next_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        selected[i + 1] = previous
+    return selected
+
+def downsample_prices(rows, max_points):
+    """
+    Reduce every ticker's daily bars to at most max_points bars with LTTB on the close.
+
+    The selected bars keep their original values, so charts show the real
+    prices at the turning points of the series.
+
+    Args:
+        rows (list): Dicts with the keys of OHLCV_FIELDS, ordered by ticker and date.
+        max_points (int): Maximum number of bars to return per ticker.
+
+    Returns:
+        list: The selected rows, still ordered by ticker and date.
+    """
+    result = []
+    start = 0
+    for end in range(1, len(rows) + 1):
+        if end == len(rows) or rows[end]['ticker'] != rows[start]['ticker']:
+            series = rows[start:end]
+            close = np.array([row['close'] if row['close'] is not None else np.nan for row in series])
+            result.extend(series[i] for i in lttb_indices(close, max_points))
+            start = end
+    return result
@@ -0,0 +1,26 @@
+from django.db import connection
+from django.http import JsonResponse
+
+class HealthCheckMiddleware:
+    """
+    Answer the Kubernetes probes before any other middleware runs.
+
+    /healthz (liveness) only checks that the process serves requests, /readyz
+    (readiness) also runs SELECT 1 on the database and returns 503 while it is
+    unreachable. Answering here skips authentication, sessions and the
+    ALLOWED_HOSTS check, which the kubelet's requests to the pod IP would fail.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if request.path == '/healthz':
+            return JsonResponse({'status': 'ok'})
+        if request.path == '/readyz':
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+            except Exception as e:
+                return JsonResponse({'status': 'unavailable', 'error': str(e)}, status=503)
+            return JsonResponse({'status': 'ok'})
+        return self.get_response(request)
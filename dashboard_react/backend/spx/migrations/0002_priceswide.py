@@ -0,0 +1,31 @@
+# Generated by Django 5.0.1 on 2026-10-18 08:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('spx', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PricesWide',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('date', models.DateField()),
+                ('ticker', models.CharField(max_length=255)),
+                ('open', models.FloatField(null=True)),
+                ('high', models.FloatField(null=True)),
+                ('low', models.FloatField(null=True)),
+                ('close', models.FloatField(null=True)),
+                ('volume', models.FloatField(null=True)),
+            ],
+            options={
+                'db_table': 'spx"."prices_wide_view',
+                'ordering': ['date', 'ticker'],
+                'managed': False,
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.0.1 on 2026-10-18 08:47
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('spx', '0002_priceswide'),
+    ]
+
+    operations = [
+        migrations.AlterModelTable(
+            name='financials',
+            table='spx"."financials',
+        ),
+        migrations.AlterModelTable(
+            name='info',
+            table='spx"."info',
+        ),
+        migrations.AlterModelTable(
+            name='priceswide',
+            table='spx"."prices_wide',
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.0.1 on 2026-10-18 08:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('spx', '0003_stored_keys'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Catalog',
+            fields=[
+                ('source', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('options', models.JSONField()),
+                ('updated_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'spx"."catalog',
+                'managed': False,
+            },
+        ),
+    ]
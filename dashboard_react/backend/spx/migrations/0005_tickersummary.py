@@ -0,0 +1,33 @@
+# Generated by Django 5.0.1 on 2026-10-18 09:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('spx', '0004_catalog'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TickerSummary',
+            fields=[
+                ('ticker', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('first_date', models.DateField()),
+                ('last_date', models.DateField()),
+                ('trading_days', models.BigIntegerField()),
+                ('latest_close', models.FloatField(null=True)),
+                ('previous_close', models.FloatField(null=True)),
+                ('daily_return', models.FloatField(null=True)),
+                ('high_52w', models.FloatField(null=True)),
+                ('low_52w', models.FloatField(null=True)),
+                ('ytd_return', models.FloatField(null=True)),
+            ],
+            options={
+                'db_table': 'spx"."ticker_summary',
+                'ordering': ['ticker'],
+                'managed': False,
+            },
+        ),
+    ]
@@ -13,7 +13,7 @@ class Info(models.Model):
 
     class Meta:
         managed = False
-        db_table = 'spx"."info_view'
+        db_table = 'spx"."info'
         ordering = ['symbol']
 
 
@@ -30,6 +30,22 @@ class Prices(models.Model):
         ordering = ['date', 'ticker', 'metric']
 
 
+class PricesWide(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    date = models.DateField()
+    ticker = models.CharField(max_length=255)
+    open = models.FloatField(null=True)
+    high = models.FloatField(null=True)
+    low = models.FloatField(null=True)
+    close = models.FloatField(null=True)
+    volume = models.FloatField(null=True)
+
+    class Meta:
+        managed = False
+        db_table = 'spx"."prices_wide'
+        ordering = ['date', 'ticker']
+
+
 class Financials(models.Model):
     id = models.BigIntegerField(primary_key=True)
     ticker = models.CharField(max_length=255)
@@ -39,8 +55,36 @@ class Financials(models.Model):
 
     class Meta:
         managed = False
-        db_table = 'spx"."financials_view'
+        db_table = 'spx"."financials'
         ordering = ['ticker', 'date', 'variable']
 
     def __str__(self):
         return f"{self.ticker} - {self.date} - {self.variable}"
+
+
+class TickerSummary(models.Model):
+    ticker = models.CharField(max_length=255, primary_key=True)
+    first_date = models.DateField()
+    last_date = models.DateField()
+    trading_days = models.BigIntegerField()
+    latest_close = models.FloatField(null=True)
+    previous_close = models.FloatField(null=True)
+    daily_return = models.FloatField(null=True)
+    high_52w = models.FloatField(null=True)
+    low_52w = models.FloatField(null=True)
+    ytd_return = models.FloatField(null=True)
+
+    class Meta:
+        managed = False
+        db_table = 'spx"."ticker_summary'
+        ordering = ['ticker']
+
+
+class Catalog(models.Model):
+    source = models.CharField(max_length=255, primary_key=True)
+    options = models.JSONField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        managed = False
+        db_table = 'spx"."catalog'
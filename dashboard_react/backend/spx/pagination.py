@@ -0,0 +1,124 @@
+import base64
+import json
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import F, Func, Value
+from django.db.models.lookups import GreaterThan, GreaterThanOrEqual
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+class KeysetPagination:
+    """
+    Keyset (seek) pagination over a unique multi-column ordering.
+
+    Instead of an OFFSET, every page starts after the ordering values of the
+    last row of the previous page, which are passed back as an opaque cursor.
+    Each page therefore costs one index range scan no matter how deep the
+    client pages, and rows are neither skipped nor repeated when the table
+    grows between requests.
+
+    Args:
+        ordering (list): Model fields whose values identify a row, e.g. ['ticker', 'date', 'metric'].
+        page_size (int, optional): Rows per page when page_size is not requested. Defaults to 1000.
+        max_page_size (int, optional): Upper bound for a requested page_size. Defaults to 10000.
+
+    Example:
+        ```python
+        pagination = KeysetPagination(['ticker', 'date', 'metric'])
+        if pagination.is_requested(request):
+            page = pagination.paginate_queryset(queryset.values('ticker', 'date', 'metric', 'value'), request)
+            return pagination.get_paginated_response(page)
+        ```
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+
+    def __init__(self, ordering, page_size=1000, max_page_size=10000):
+        self.ordering = list(ordering)
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+
+    def is_requested(self, request):
+        """Return True if the request asks for a page rather than the full list."""
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def encode_cursor(self, obj):
+        """Return the cursor pointing just after obj (a model instance or a values() dict)."""
+        position = [str(obj[field] if isinstance(obj, dict) else getattr(obj, field)) for field in self.ordering]
+        return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+    def decode_cursor(self, request):
+        """Return the ordering values encoded in the request's cursor, or None for the first page."""
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except (ValueError, TypeError):
+            raise ValidationError({self.cursor_query_param: 'Invalid cursor'})
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise ValidationError({self.cursor_query_param: 'Invalid cursor'})
+        return position
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (ValueError, TypeError):
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def _after(self, model, position):
+        """
+        Build the filters for rows ordered after position as row-value comparisons.
+
+        (a, b, c) > (x, y, z) selects the rows after position. Unlike the
+        equivalent OR chain, PostgreSQL matches a row comparison against a
+        multi-column index on the same columns and starts a single index range
+        scan at the position. The redundant (a, b) >= (x, y) keeps that range
+        scan when the last column is not indexed, e.g. the metric that the
+        prices view derives from the (ticker, date) rows of prices_wide.
+        """
+        fields = [model._meta.get_field(field) for field in self.ordering]
+        try:
+            values = [Value(field.to_python(value), output_field=field) for field, value in zip(fields, position)]
+        except DjangoValidationError:
+            raise ValidationError({self.cursor_query_param: 'Invalid cursor'})
+
+        def row(expressions):
+            return Func(*expressions, function='ROW', output_field=fields[0])
+
+        columns = [F(field) for field in self.ordering]
+        filters = [GreaterThan(row(columns), row(values))]
+        if len(columns) > 1:
+            filters.append(GreaterThanOrEqual(row(columns[:-1]), row(values[:-1])))
+        return filters
+
+    def paginate_queryset(self, queryset, request):
+        """
+        Return the objects (or values() dicts) of the requested page and remember the cursor of the next one.
+
+        Raises:
+            rest_framework.exceptions.ValidationError: If the cursor cannot be decoded (HTTP 400).
+        """
+        self.request = request
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(*self._after(queryset.model, position))
+        page_size = self.get_page_size(request)
+
+        # Fetch one extra row to know whether another page follows
+        page = list(queryset.order_by(*self.ordering)[:page_size + 1])
+        self.next_cursor = self.encode_cursor(page[page_size - 1]) if len(page) > page_size else None
+        return page[:page_size]
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data
+        })
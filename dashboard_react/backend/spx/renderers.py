@@ -0,0 +1,150 @@
+import math
+from rest_framework.renderers import BaseRenderer, BrowsableAPIRenderer, JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+def _finite(value):
+    """Replace NaN and infinite floats by None, which JSON cannot represent otherwise."""
+    if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
+        return None
+    return value
+
+def sanitize(data):
+    """Recursively replace NaN and infinite floats in lists and dicts by None."""
+    if isinstance(data, dict):
+        return {key: sanitize(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [sanitize(value) for value in data]
+    return _finite(data)
+
+def dumps(data):
+    """
+    Encode data as compact JSON bytes, writing NaN and infinite floats as null.
+
+    Uses orjson when it is installed, which encodes dates, lists and dicts in C
+    and already writes non-finite floats as null. Without orjson the data is
+    sanitized and encoded with DRF's own encoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return JSONRenderer().render(sanitize(data))
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSON renderer for bulk payloads built from values()/values_list() rows.
+
+    Rows are encoded directly with dumps() instead of the standard library
+    encoder, and NaN/Inf values become null in the same pass, so list endpoints
+    can skip ModelSerializer and its per-row field machinery. Indented output
+    requested by the browsable API falls back to JSONRenderer.
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(sanitize(data), accepted_media_type, renderer_context)
+        return dumps(data)
+
+def to_columnar(rows, group_by):
+    """
+    Regroup row dicts into one dict of column arrays per series.
+
+    Rows sharing the values of the group_by keys form a series, whose other
+    fields become arrays in row order, e.g. the Close prices of AAPL become
+    {"ticker": "AAPL", "metric": "Close", "date": [...], "value": [...]}.
+    Group keys missing from the rows are ignored.
+
+    Args:
+        rows (list): Row dicts sharing the same keys.
+        group_by (tuple): Keys identifying a series, e.g. ('ticker', 'metric').
+
+    Returns:
+        list: One dict per series, in order of first appearance.
+    """
+    if not rows:
+        return []
+    keys = [key for key in group_by if key in rows[0]]
+    columns = [key for key in rows[0] if key not in keys]
+    groups = {}
+    for row in rows:
+        group_key = tuple(row[key] for key in keys)
+        group = groups.get(group_key)
+        if group is None:
+            group = groups[group_key] = {**dict(zip(keys, group_key)), **{column: [] for column in columns}}
+        for column in columns:
+            group[column].append(row[column])
+    return list(groups.values())
+
+class ColumnarJSONRenderer(JSONRenderer):
+    """
+    Compact JSON with one object of column arrays per series instead of one object per row.
+
+    Selected with ?format=columnar or Accept: application/vnd.spx.columnar+json.
+    Lists (and the results of paginated responses) are regrouped with
+    to_columnar on the view's columnar_group_by keys, so keys and repeated
+    ticker/metric strings are written once per series instead of once per
+    point. Other payloads are rendered as plain JSON.
+    """
+    media_type = 'application/vnd.spx.columnar+json'
+    format = 'columnar'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        view = (renderer_context or {}).get('view')
+        group_by = getattr(view, 'columnar_group_by', ('ticker',))
+        if isinstance(data, list):
+            data = to_columnar(data, group_by)
+        elif isinstance(data, dict) and isinstance(data.get('results'), list):
+            data = {**data, 'results': to_columnar(data['results'], group_by)}
+        return dumps(data)
+
+class ArrowRenderer(BaseRenderer):
+    """
+    Apache Arrow IPC stream of the rows, for clients that read columnar buffers directly.
+
+    Selected with ?format=arrow or Accept: application/vnd.apache.arrow.stream,
+    and only offered when pyarrow is installed. String columns are
+    dictionary-encoded, so each ticker and metric is stored once. The next link
+    of a paginated response is kept in the schema metadata under b'next'.
+    """
+    media_type = 'application/vnd.apache.arrow.stream'
+    format = 'arrow'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        metadata = None
+        if isinstance(data, dict) and isinstance(data.get('results'), list):
+            metadata = {'next': data.get('next') or ''}
+            data = data['results']
+        elif isinstance(data, dict):
+            # Non-tabular payloads (errors, filter options) become a single row
+            data = [data]
+
+        table = pa.Table.from_pylist(data)
+        for i, field in enumerate(table.schema):
+            if pa.types.is_string(field.type):
+                table = table.set_column(i, field.name, table.column(i).dictionary_encode())
+        if metadata:
+            table = table.replace_schema_metadata(metadata)
+
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+# Renderers of the tabular endpoints: JSON rows, columnar JSON and, if available, Arrow
+TABLE_RENDERERS = ([FastJSONRenderer, ColumnarJSONRenderer]
+                   + ([ArrowRenderer] if pa is not None else [])
+                   + [BrowsableAPIRenderer])
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Info, Prices, Financials
+from .models import Info, Prices, PricesWide, Financials, TickerSummary
 import math
 
 class InfoSerializer(serializers.ModelSerializer):
@@ -13,6 +13,17 @@ class PricesSerializer(serializers.ModelSerializer):
         model = Prices
         fields = ('date', 'ticker', 'metric', 'value')
 
+class PricesWideSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = PricesWide
+        fields = ('date', 'ticker', 'open', 'high', 'low', 'close', 'volume')
+
+class TickerSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = TickerSummary
+        fields = ('ticker', 'first_date', 'last_date', 'trading_days', 'latest_close', 'previous_close',
+                  'daily_return', 'high_52w', 'low_52w', 'ytd_return')
+
 class FinancialsSerializer(serializers.ModelSerializer):
     value = serializers.SerializerMethodField()
 
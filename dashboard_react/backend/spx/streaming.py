@@ -0,0 +1,78 @@
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from .renderers import dumps
+
+def _encode_chunk(chunk, first):
+    """Encode a chunk of rows as array elements, with a leading comma unless it is the first chunk."""
+    # Encode the chunk as an array and drop its brackets
+    return (b'' if first else b',') + dumps(chunk)[1:-1]
+
+def iter_json_array(rows, rows_per_chunk=1000):
+    """
+    Encode dicts as a JSON array, yielding one bytes string per chunk of rows.
+
+    Every chunk is encoded in one dumps() call, so NaN and infinite values
+    are written as null.
+
+    Args:
+        rows (iterable): Dicts to encode, consumed lazily.
+        rows_per_chunk (int, optional): Rows encoded per yielded string. Defaults to 1000.
+    """
+    yield b'['
+    chunk = []
+    first = True
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= rows_per_chunk:
+            yield _encode_chunk(chunk, first)
+            first = False
+            chunk = []
+    if chunk:
+        yield _encode_chunk(chunk, first)
+    yield b']'
+
+async def aiter_json_array(rows, rows_per_chunk=1000):
+    """Async iter_json_array() over an async iterable of dicts, e.g. QuerySet.aiterator()."""
+    yield b'['
+    chunk = []
+    first = True
+    async for row in rows:
+        chunk.append(row)
+        if len(chunk) >= rows_per_chunk:
+            yield _encode_chunk(chunk, first)
+            first = False
+            chunk = []
+    if chunk:
+        yield _encode_chunk(chunk, first)
+    yield b']'
+
+def is_asgi(request):
+    """Return True if the (Django or DRF) request is served by the ASGI handler."""
+    return isinstance(getattr(request, '_request', request), ASGIRequest)
+
+def streaming_json_response(queryset, fields, chunk_size=2000, asynchronous=False):
+    """
+    Stream the given fields of a queryset as a JSON array.
+
+    Rows are read with a server-side cursor (QuerySet.iterator) and written as
+    they arrive, so memory stays bounded by chunk_size rows however large the
+    result is. The body is the same JSON array the list endpoints return.
+
+    Under ASGI, Django reads a synchronous streaming body into a list before
+    sending it, so ASGI requests must pass asynchronous=True, which streams
+    the rows from QuerySet.aiterator() instead.
+
+    Args:
+        queryset (django.db.models.QuerySet): Filtered and ordered queryset.
+        fields (tuple): Model fields to include, in output order.
+        chunk_size (int, optional): Rows fetched from the database per round trip. Defaults to 2000.
+        asynchronous (bool, optional): Stream with an async iterator, see is_asgi(). Defaults to False.
+
+    Returns:
+        django.http.StreamingHttpResponse: The streaming response.
+    """
+    if asynchronous:
+        rows = queryset.values(*fields).aiterator(chunk_size=chunk_size)
+        return StreamingHttpResponse(aiter_json_array(rows), content_type='application/json')
+    rows = queryset.values(*fields).iterator(chunk_size=chunk_size)
+    return StreamingHttpResponse(iter_json_array(rows), content_type='application/json')
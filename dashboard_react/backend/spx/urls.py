@@ -1,12 +1,26 @@
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import InfoViewSet, PricesViewSet, FinancialsViewSet
+from .views import InfoViewSet, PricesViewSet, PricesWideViewSet, SummaryViewSet, FinancialsViewSet
 
 router = DefaultRouter()
 router.register(r'info', InfoViewSet, basename='info')
 router.register(r'prices', PricesViewSet, basename='prices')
+router.register(r'prices-wide', PricesWideViewSet, basename='prices-wide')
+router.register(r'summary', SummaryViewSet, basename='summary')
 router.register(r'financials', FinancialsViewSet, basename='financials')
 
 urlpatterns = [
     path('', include(router.urls)),
 ]
+
+# Under ASGI the price and financial lists are served by async views, which take precedence over the router
+if settings.ASYNC_VIEWS:
+    from . import async_db, async_views
+    if async_db.AsyncConnectionPool is None:
+        raise ImproperlyConfigured("DJANGO_ASYNC_VIEWS requires psycopg and psycopg-pool")
+    urlpatterns = [
+        path('prices/', async_views.prices_list),
+        path('financials/', async_views.financials_list),
+    ] + urlpatterns
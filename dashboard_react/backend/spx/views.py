@@ -1,11 +1,107 @@
-from rest_framework import viewsets
+from rest_framework import status, viewsets
 from rest_framework.response import Response
 from django.db.models import Min, Max
-from .models import Info, Prices, Financials
-from .serializers import InfoSerializer, PricesSerializer, FinancialsSerializer
+from .models import Info, Prices, PricesWide, Financials, TickerSummary, Catalog
+from .serializers import InfoSerializer, PricesSerializer, TickerSummarySerializer, FinancialsSerializer
+from .downsampling import INTERVALS, OHLCV_FIELDS, resample_prices, downsample_prices
+from .pagination import KeysetPagination
+from .streaming import is_asgi, streaming_json_response
+from .renderers import TABLE_RENDERERS
+from .caching import cached_endpoint
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+
+def catalog_options(source):
+    """Return the filter options the ETL stored in spx.catalog for a data set, or None before its first load."""
+    return Catalog.objects.filter(source=source).values_list('options', flat=True).first()
+
+# Price metrics offered before the catalog has been built
+PRICE_METRICS = ['Close', 'High', 'Low', 'Open', 'Volume']
+
+def requested_metrics(params, valid=None):
+    """
+    Return the price metrics selected by the query parameters, or an empty list for all of them.
+
+    Metrics can be given as metrics[]=Close&metrics[]=Open or as
+    metric=Close,Open, and both forms can be combined. Every name must be a
+    metric of the prices catalog.
+
+    Args:
+        params (django.http.QueryDict): Query parameters of the request.
+        valid (list, optional): Valid metric names. Read from the catalog when not given.
+
+    Raises:
+        rest_framework.exceptions.ValidationError: If a metric is unknown (HTTP 400).
+    """
+    metrics = params.getlist('metrics[]', [])
+    for value in params.getlist('metric', []):
+        metrics.extend(value.split(','))
+    metrics = list(dict.fromkeys(metric.strip() for metric in metrics if metric.strip()))
+    if not metrics:
+        return metrics
+
+    if valid is None:
+        valid = (catalog_options('prices') or {}).get('metrics', PRICE_METRICS)
+    unknown = [metric for metric in metrics if metric not in valid]
+    if unknown:
+        raise ValidationError({'metric': f"Unknown metrics: {', '.join(unknown)}. "
+                                         f"Valid metrics are {', '.join(valid)}"})
+    return metrics
+
+def wide_fields(metrics):
+    """Return the prices_wide fields holding the given metrics (all OHLCV fields if none are given)."""
+    if not metrics:
+        return OHLCV_FIELDS
+    return ('date', 'ticker', *(metric.lower() for metric in metrics))
+
+def filter_symbols_and_dates(queryset, params):
+    """Filter a queryset with ticker and date columns by the symbols[] and date_min/date_max parameters."""
+    # Symbol filter
+    symbols = params.getlist('symbols[]', [])
+    if symbols:
+        queryset = queryset.filter(ticker__in=symbols)
+
+    # Date range filter
+    date_min = params.get('date_min')
+    date_max = params.get('date_max')
+    if date_min:
+        queryset = queryset.filter(date__gte=date_min)
+    if date_max:
+        queryset = queryset.filter(date__lte=date_max)
+    return queryset
+
+def filter_prices(params, valid_metrics=None):
+    """Return the Prices queryset filtered by the symbols[], metric/metrics[] and date_min/date_max parameters."""
+    queryset = filter_symbols_and_dates(Prices.objects.all(), params)
+
+    # Metric filter (metrics[]=Close or metric=Close)
+    metrics = requested_metrics(params, valid_metrics)
+    if metrics:
+        queryset = queryset.filter(metric__in=metrics)
+    return queryset
+
+def filter_financials(params):
+    """Return the Financials queryset filtered by the symbols[], variables[] and date_min/date_max parameters."""
+    queryset = filter_symbols_and_dates(Financials.objects.all(), params)
+
+    # Variable filter
+    variables = params.getlist('variables[]', [])
+    if variables:
+        queryset = queryset.filter(variable__in=variables)
+    return queryset
+
+def apply_limit(queryset, params):
+    """Slice the queryset to the limit parameter, ignoring values that are not integers."""
+    limit = params.get('limit')
+    if limit:
+        try:
+            return queryset[:int(limit)]
+        except (ValueError, TypeError):
+            pass
+    return queryset
 
 class InfoViewSet(viewsets.ViewSet):
+    @cached_endpoint
     def list(self, request):
         queryset = Info.objects.all()
         
@@ -39,8 +135,12 @@ class InfoViewSet(viewsets.ViewSet):
         return Response(serializer.data)
     
     @action(detail=False, methods=['get'])
+    @cached_endpoint
     def filter_options(self, request):
         """Return unique values for different fields to populate filters"""
+        options = catalog_options('info')
+        if options is not None:
+            return Response(options)
         founded_range = Info.objects.aggregate(
             min_founded=Min('founded'),
             max_founded=Max('founded')
@@ -57,41 +157,35 @@ class InfoViewSet(viewsets.ViewSet):
         })
 
 class PricesViewSet(viewsets.ViewSet):
+    renderer_classes = TABLE_RENDERERS
+    columnar_group_by = ('ticker', 'metric')
+
+    @cached_endpoint
     def list(self, request):
-        queryset = Prices.objects.all()
-        
-        # Symbol filter
-        symbols = request.query_params.getlist('symbols[]', [])
-        if symbols:
-            queryset = queryset.filter(ticker__in=symbols)
-            
-        # Metric filter
-        metrics = request.query_params.getlist('metrics[]', [])
-        if metrics:
-            queryset = queryset.filter(metric__in=metrics)
-            
-        # Date range filter
-        date_min = request.query_params.get('date_min')
-        date_max = request.query_params.get('date_max')
-        if date_min:
-            queryset = queryset.filter(date__gte=date_min)
-        if date_max:
-            queryset = queryset.filter(date__lte=date_max)
+        queryset = filter_prices(request.query_params)
+
+        # Keyset pagination on (ticker, date, metric) when a cursor or page_size is given
+        pagination = KeysetPagination(['ticker', 'date', 'metric'])
+        if pagination.is_requested(request):
+            page = pagination.paginate_queryset(queryset.values(*PricesSerializer.Meta.fields), request)
+            return pagination.get_paginated_response(page)
         
-        limit = request.query_params.get('limit')
-        if limit:
-            try:
-                limit = int(limit)
-                queryset = queryset[:limit]
-            except (ValueError, TypeError):
-                pass
-                
-        serializer = PricesSerializer(queryset, many=True)
-        return Response(serializer.data)
+        queryset = apply_limit(queryset, request.query_params)
+
+        # Stream the rows straight from a server-side cursor
+        if request.query_params.get('stream') == 'true':
+            return streaming_json_response(queryset, PricesSerializer.Meta.fields, asynchronous=is_asgi(request))
+
+        # Plain rows encoded by FastJSONRenderer, skipping the per-row serializer
+        return Response(list(queryset.values(*PricesSerializer.Meta.fields)))
 
     @action(detail=False, methods=['get'])
+    @cached_endpoint
     def filter_options(self, request):
         """Return available filter options"""
+        options = catalog_options('prices')
+        if options is not None:
+            return Response(options)
         date_range = Prices.objects.aggregate(
             min_date=Min('date'),
             max_date=Max('date')
@@ -104,46 +198,127 @@ class PricesViewSet(viewsets.ViewSet):
             }
         })
 
-class FinancialsViewSet(viewsets.ViewSet):
-    def list(self, request):
-        try:
-            queryset = Financials.objects.all()
-            
-            # Symbol filter
-            symbols = request.query_params.getlist('symbols[]', [])
-            if symbols:
-                queryset = queryset.filter(ticker__in=symbols)
-                
-            # Variable filter
-            variables = request.query_params.getlist('variables[]', [])
-            if variables:
-                queryset = queryset.filter(variable__in=variables)
-                
-            # Date range filter
-            date_min = request.query_params.get('date_min')
-            date_max = request.query_params.get('date_max')
+    @action(detail=False, methods=['get'])
+    @cached_endpoint
+    def resample(self, request):
+        """
+        Return OHLCV bars reduced for charting.
+
+        interval=week|month aggregates the daily bars per calendar bucket in SQL,
+        max_points=N keeps at most N bars per ticker selected with LTTB on the
+        close. Both can be combined. metrics[]/metric limits the bars to the
+        given OHLCV values.
+        """
+        symbols = request.query_params.getlist('symbols[]', [])
+        if not symbols:
+            return Response({'error': 'At least one symbols[] value is required'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        interval = request.query_params.get('interval')
+        if interval is not None and interval not in INTERVALS:
+            return Response({'error': f"interval must be one of {', '.join(INTERVALS)}"},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        max_points = request.query_params.get('max_points')
+        if max_points is not None:
+            try:
+                max_points = int(max_points)
+            except (ValueError, TypeError):
+                max_points = 0
+            if max_points < 3:
+                return Response({'error': 'max_points must be an integer of at least 3'},
+                                status=status.HTTP_400_BAD_REQUEST)
+
+        if interval is None and max_points is None:
+            return Response({'error': 'interval or max_points is required'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        metrics = requested_metrics(request.query_params)
+        date_min = request.query_params.get('date_min')
+        date_max = request.query_params.get('date_max')
+        if interval:
+            rows = resample_prices(symbols, interval, date_min, date_max)
+        else:
+            queryset = PricesWide.objects.filter(ticker__in=symbols)
             if date_min:
                 queryset = queryset.filter(date__gte=date_min)
             if date_max:
                 queryset = queryset.filter(date__lte=date_max)
+            rows = list(queryset.order_by('ticker', 'date').values(*OHLCV_FIELDS))
+
+        if max_points:
+            rows = downsample_prices(rows, max_points)
+        if metrics:
+            fields = wide_fields(metrics)
+            rows = [{field: row[field] for field in fields} for row in rows]
+        return Response(rows)
+
+class PricesWideViewSet(viewsets.ViewSet):
+    renderer_classes = TABLE_RENDERERS
+    columnar_group_by = ('ticker',)
+
+    @cached_endpoint
+    def list(self, request):
+        """Return one row per ticker and day with the OHLCV columns (candlestick data)"""
+        fields = wide_fields(requested_metrics(request.query_params))
+        queryset = filter_symbols_and_dates(PricesWide.objects.all(), request.query_params)
+        queryset = apply_limit(queryset, request.query_params)
+
+        # Plain rows encoded by FastJSONRenderer, skipping the per-row serializer
+        return Response(list(queryset.values(*fields)))
+
+class SummaryViewSet(viewsets.ViewSet):
+    renderer_classes = TABLE_RENDERERS
+
+    @cached_endpoint
+    def list(self, request):
+        """Return the per-ticker summary (latest close, returns, 52-week range, coverage) maintained by the prices ETL"""
+        queryset = TickerSummary.objects.all()
+
+        # Symbol filter
+        symbols = request.query_params.getlist('symbols[]', [])
+        if symbols:
+            queryset = queryset.filter(ticker__in=symbols)
+
+        return Response(list(queryset.values(*TickerSummarySerializer.Meta.fields)))
+
+class FinancialsViewSet(viewsets.ViewSet):
+    renderer_classes = TABLE_RENDERERS
+    columnar_group_by = ('ticker', 'variable')
+
+    @cached_endpoint
+    def list(self, request):
+        try:
+            queryset = filter_financials(request.query_params)
+
+            # Keyset pagination on (ticker, date, variable) when a cursor or page_size is given
+            pagination = KeysetPagination(['ticker', 'date', 'variable'])
+            if pagination.is_requested(request):
+                page = pagination.paginate_queryset(queryset.values(*FinancialsSerializer.Meta.fields), request)
+                return pagination.get_paginated_response(page)
                 
-            limit = request.query_params.get('limit')
-            if limit:
-                try:
-                    limit = int(limit)
-                    queryset = queryset[:limit]
-                except (ValueError, TypeError):
-                    pass
-                    
-            serializer = FinancialsSerializer(queryset, many=True)
-            return Response(serializer.data)
+            queryset = apply_limit(queryset, request.query_params)
+
+            # Stream the rows straight from a server-side cursor
+            if request.query_params.get('stream') == 'true':
+                return streaming_json_response(queryset, FinancialsSerializer.Meta.fields,
+                                                   asynchronous=is_asgi(request))
+
+            # Plain rows encoded by FastJSONRenderer, which writes NaN/Inf values as null
+            return Response(list(queryset.values(*FinancialsSerializer.Meta.fields)))
+        except ValidationError:
+            raise
         except Exception as e:
             print(f"Error processing financials request: {str(e)}")
             return Response([])
 
     @action(detail=False, methods=['get'])
+    @cached_endpoint
     def filter_options(self, request):
         """Return available filter options"""
+        options = catalog_options('financials')
+        if options is not None:
+            return Response(options)
         date_range = Financials.objects.aggregate(
             min_date=Min('date'),
             max_date=Max('date')
@@ -2,7 +2,7 @@ import { useState, useEffect, useMemo } from 'react';
 import 'ag-grid-community/styles/ag-grid.css';
 import 'ag-grid-community/styles/ag-theme-alpine.css';
 import { Company, Price, Financial, FilterOptions } from '@/types/interfaces';
-import { fetchFilterOptions, fetchCompanyData, fetchPriceData, fetchFinancialsData } from '@/services/api';
+import { fetchFilterOptions, fetchCompanyData, fetchSummaryData, fetchPriceData, fetchFinancialsData } from '@/services/api';
 import { StatsCards } from '@/components/dashboard/StatsCards';
 import { Filters } from '@/components/dashboard/Filters';
 import { CompanyGrid } from '@/components/dashboard/CompanyGrid';
@@ -71,13 +71,26 @@ const App = () => {
       setInitializing(true);
       try {
         // Fetch initial data in parallel
-        const [options, data] = await Promise.all([
+        const [options, data, summary] = await Promise.all([
           fetchFilterOptions(),
-          fetchCompanyData([], [], [])
+          fetchCompanyData([], [], []),
+          fetchSummaryData()
         ]);
 
+        // Merge the precomputed market data into the company rows
+        const summaryByTicker = new Map(summary.map(row => [row.ticker, row]));
         setFilterOptions(options);
-        setInfoData(data);
+        setInfoData(data.map(company => {
+          const row = summaryByTicker.get(company.symbol);
+          return row ? {
+            ...company,
+            latest_close: row.latest_close,
+            daily_return: row.daily_return,
+            ytd_return: row.ytd_return,
+            high_52w: row.high_52w,
+            low_52w: row.low_52w,
+          } : company;
+        }));
 
         // Fetch initial prices and financials for AAPL
         const [prices, financials] = await Promise.all([
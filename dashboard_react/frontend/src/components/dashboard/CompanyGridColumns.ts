@@ -1,4 +1,4 @@
-import { dateFormatter } from '@/utils/formatters';
+import { dateFormatter, gridCurrencyFormatter, percentFormatter } from '@/utils/formatters';
 import { ColDef } from 'ag-grid-community';
 
 export const infoColumns: ColDef[] = [
@@ -58,5 +58,45 @@ export const infoColumns: ColDef[] = [
     sortable: true,
     width: 120,
     suppressMovable: true
+  },
+  { 
+    field: 'latest_close',
+    headerName: 'Last Close',
+    sortable: true,
+    width: 130,
+    valueFormatter: gridCurrencyFormatter,
+    suppressMovable: true
+  },
+  { 
+    field: 'daily_return',
+    headerName: '1D',
+    sortable: true,
+    width: 100,
+    valueFormatter: percentFormatter,
+    suppressMovable: true
+  },
+  { 
+    field: 'ytd_return',
+    headerName: 'YTD',
+    sortable: true,
+    width: 100,
+    valueFormatter: percentFormatter,
+    suppressMovable: true
+  },
+  { 
+    field: 'high_52w',
+    headerName: '52W High',
+    sortable: true,
+    width: 130,
+    valueFormatter: gridCurrencyFormatter,
+    suppressMovable: true
+  },
+  { 
+    field: 'low_52w',
+    headerName: '52W Low',
+    sortable: true,
+    width: 130,
+    valueFormatter: gridCurrencyFormatter,
+    suppressMovable: true
   }
 ];
@@ -1,4 +1,4 @@
-import { Company, Price, FilterOptions, Financial } from '@/types/interfaces';
+import { Company, Price, PriceBar, FilterOptions, Financial, TickerSummary } from '@/types/interfaces';
 
 // API Configuration using environment variables
 const API_TOKEN = import.meta.env.VITE_API_TOKEN;
@@ -60,23 +60,47 @@ export const fetchCompanyData = async (
   return await response.json();
 };
 
+{/*****************************************************************************/}
+{/* Ticker Summary API */}
+/**
+ * Fetches the per-ticker summary (latest close, returns, 52-week range)
+ * Endpoint: GET /api/summary/
+ */
+export const fetchSummaryData = async (): Promise<TickerSummary[]> => {
+  const response = await fetch('/api/summary/', { headers });
+  if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
+  return await response.json();
+};
+
 {/*****************************************************************************/}
 {/* Price Data API */}
+// Maximum number of bars per chart, the server downsamples longer series
+const MAX_CHART_POINTS = 500;
+const PRICE_METRICS = ['Open', 'High', 'Low', 'Close', 'Volume'] as const;
+
 /**
- * Fetches price data for a specific symbol
- * Endpoint: GET /api/prices/?symbols[]=SYMBOL&metric=Close
+ * Fetches price data for a specific symbol, downsampled for charting
+ * Endpoint: GET /api/prices/resample/?symbols[]=SYMBOL&max_points=N
  */
 export const fetchPriceData = async (symbol: string): Promise<Price[]> => {
   // Return empty array if no symbol provided
   if (!symbol) return [];
 
-  // Fetch price data for the symbol
+  // Fetch at most MAX_CHART_POINTS OHLCV bars for the symbol
   const response = await fetch(
-    `/api/prices/?symbols[]=${symbol}&metric=Close`,
+    `/api/prices/resample/?symbols[]=${encodeURIComponent(symbol)}&max_points=${MAX_CHART_POINTS}`,
     { headers }
   );
   if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
-  return await response.json();
+  const bars: PriceBar[] = await response.json();
+
+  // Unpivot the bars into one record per metric
+  return bars.flatMap(bar => PRICE_METRICS.map(metric => ({
+    date: bar.date,
+    ticker: bar.ticker,
+    metric,
+    value: bar[metric.toLowerCase() as Lowercase<typeof metric>],
+  })));
 };
 
 {/*****************************************************************************/}
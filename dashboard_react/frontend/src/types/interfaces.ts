@@ -7,6 +7,25 @@ export interface Company {
   date_added: string;
   cik: number;
   founded: string;
+  // Market data merged in from the ticker summary
+  latest_close?: number | null;
+  daily_return?: number | null;
+  ytd_return?: number | null;
+  high_52w?: number | null;
+  low_52w?: number | null;
+}
+
+export interface TickerSummary {
+  ticker: string;
+  first_date: string;
+  last_date: string;
+  trading_days: number;
+  latest_close: number | null;
+  previous_close: number | null;
+  daily_return: number | null;
+  high_52w: number | null;
+  low_52w: number | null;
+  ytd_return: number | null;
 }
 
 export interface Price {
@@ -16,6 +35,16 @@ export interface Price {
   value: number;
 }
 
+export interface PriceBar {
+  date: string;
+  ticker: string;
+  open: number;
+  high: number;
+  low: number;
+  close: number;
+  volume: number;
+}
+
 export interface Financial {
   date: string;
   ticker: string;
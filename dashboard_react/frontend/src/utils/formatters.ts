@@ -13,3 +13,14 @@ export const currencyFormatter = (value: number | null | undefined) => {
     maximumFractionDigits: 2
   })}`;
 };
+
+export const gridCurrencyFormatter = (params: any) => {
+  return params.value === null || params.value === undefined ? '' : currencyFormatter(params.value);
+};
+
+export const percentFormatter = (params: any) => {
+  if (params.value === null || params.value === undefined || !isFinite(params.value)) {
+    return '';
+  }
+  return `${(params.value * 100).toFixed(2)}%`;
+};
@@ -2,11 +2,15 @@ import warnings
 warnings.filterwarnings('ignore')
 
 import os
+import time
+import threading
 import psycopg2
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 import pandas as pd
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
+import snapshot_backend
 
 ############################################################################
 # Page Configurations
@@ -43,10 +47,37 @@ password = password.strip()
 database = database.strip()
 
 ############################################################################
-# PostgreSQL to Pandas DataFrame Function
-def postgresql(sql_query, host, user, password, database, port):
-    # Connect to the database
-    conn = psycopg2.connect(
+# Connection Pool
+# ThreadedConnectionPool raises PoolError as soon as all maxconn connections are
+# checked out, a semaphore makes getconn wait for a free one instead
+class BlockingConnectionPool(ThreadedConnectionPool):
+    def __init__(self, minconn, maxconn, *args, timeout=30, **kwargs):
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._timeout = timeout
+        super().__init__(minconn, maxconn, *args, **kwargs)
+
+    def getconn(self, key=None):
+        if not self._slots.acquire(timeout=self._timeout):
+            raise PoolError(f"no free connection after waiting {self._timeout}s")
+        try:
+            return super().getconn(key)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn=None, key=None, close=False):
+        try:
+            super().putconn(conn, key, close)
+        finally:
+            self._slots.release()
+
+# Held once per server process and shared by all sessions and reruns
+@st.cache_resource
+def get_connection_pool(host, user, password, database, port):
+    return BlockingConnectionPool(
+        minconn=1,
+        maxconn=int(os.getenv('DB_POOL_MAX_SIZE', '10')),
+        timeout=float(os.getenv('DB_POOL_TIMEOUT', '30')),
         host=host,
         port=port,
         user=user,
@@ -54,79 +85,231 @@ def postgresql(sql_query, host, user, password, database, port):
         dbname=database
     )
 
-    # Create a new cursor
-    cur = conn.cursor()
-
-    # Execute the query
-    cur.execute(sql_query)
-
-    # Get the column names
-    colnames = [desc[0] for desc in cur.description]
+############################################################################
+# PostgreSQL to Pandas DataFrame Function
+def postgresql(sql_query, params=None, dtypes=None, pool=None):
+    # The prewarm poller passes its pool, st.cache_resource only works inside a page run
+    if pool is None:
+        pool = get_connection_pool(host, user, password, database, port)
+
+    # Retry once on a fresh connection if a pooled one was dropped (e.g. database restart)
+    for attempt in range(2):
+        conn = pool.getconn()
+        broken = False
+        try:
+            # Read-only queries, no transaction is left open on the pooled connection
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                # Parameters are passed separately, e.g. ticker = ANY(%s) with a list
+                cur.execute(sql_query, params)
+                colnames = [desc[0] for desc in cur.description]
+                data = cur.fetchall()
+            break
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            broken = True
+            if attempt == 1:
+                raise
+        finally:
+            # Every connection goes back to the pool, whatever the error; broken ones are discarded
+            pool.putconn(conn, close=broken or conn.closed != 0)
+
+    # Create a DataFrame with the requested column types
+    df = pd.DataFrame(data, columns=colnames)
+    if dtypes:
+        df = df.astype(dtypes)
+    return df
 
-    # Fetch the data
-    data = cur.fetchall()
+############################################################################
+# Data Backend
+# 'postgres' queries PostgreSQL, 'duckdb' queries the Parquet snapshot that
+# 05_export_snapshot writes to SNAPSHOT_DIR, without any load on the database
+DATA_BACKEND = os.getenv('DATA_BACKEND', 'postgres')
+SNAPSHOT_DIR = os.getenv('SNAPSHOT_DIR', '/snapshot')
+
+# Embedded DuckDB database, held once per server process
+@st.cache_resource
+def get_duckdb_connection():
+    return snapshot_backend.connect()
+
+# Connection pool (or DuckDB connection) of the configured backend
+def data_connection():
+    if DATA_BACKEND == 'duckdb':
+        return get_duckdb_connection()
+    return get_connection_pool(host, user, password, database, port)
 
-    # Close the cursor
-    cur.close()
+############################################################################
+# Data Loading Functions
+# Uncached, called by the cached loaders below and by the prewarm poller,
+# which is why they take the connection as an argument
+def read_data_version(conn):
+    if DATA_BACKEND == 'duckdb':
+        return snapshot_backend.read_snapshot_version(SNAPSHOT_DIR)
+    df_version = postgresql("SELECT coalesce(max(id), 0) AS version FROM spx.etl_runs", pool=conn)
+    return int(df_version['version'].iloc[0])
+
+def load_spx_info(conn, version):
+    if DATA_BACKEND == 'duckdb':
+        return snapshot_backend.query_info(conn, SNAPSHOT_DIR, version)
+    query = ("SELECT symbol, security, gics_sector, gics_sub_industry, headquarters_location, "
+             "date_added, cik, founded FROM spx.info ORDER BY symbol")
+    # founded as int, cik as str
+    return postgresql(query, dtypes={'founded': int, 'cik': str}, pool=conn)
+
+# One row per ticker and day with all OHLCV columns, feeding every metric
+def load_spx_prices(conn, symbols, version):
+    if DATA_BACKEND == 'duckdb':
+        return snapshot_backend.query_prices(conn, SNAPSHOT_DIR, symbols, version)
+    query = ("SELECT date, ticker, open, high, low, close, volume FROM spx.prices_wide "
+             "WHERE ticker = ANY(%s) ORDER BY ticker, date")
+    return postgresql(query, (list(symbols),),
+                      dtypes={'date': 'datetime64[ns]', 'open': float, 'high': float,
+                              'low': float, 'close': float, 'volume': float}, pool=conn)
+
+# Read from the catalog maintained by the prices ETL instead of scanning a price series
+def load_spx_price_dates(conn, version):
+    if DATA_BACKEND == 'duckdb':
+        return snapshot_backend.query_price_dates(conn, SNAPSHOT_DIR, version)
+    query = ("SELECT (options -> 'date_range' ->> 'min')::date AS earliest_date, "
+             "(options -> 'date_range' ->> 'max')::date AS latest_date "
+             "FROM spx.catalog WHERE source = 'prices'")
+    df_dates = postgresql(query, dtypes={'earliest_date': 'datetime64[ns]', 'latest_date': 'datetime64[ns]'},
+                          pool=conn)
+    if df_dates.empty:
+        # Before the first catalog refresh
+        df_dates = postgresql("SELECT min(date) AS earliest_date, max(date) AS latest_date FROM spx.prices_wide",
+                              dtypes={'earliest_date': 'datetime64[ns]', 'latest_date': 'datetime64[ns]'},
+                              pool=conn)
+    return df_dates['earliest_date'].iloc[0], df_dates['latest_date'].iloc[0]
+
+def load_spx_financials(conn, symbols, version):
+    if DATA_BACKEND == 'duckdb':
+        return snapshot_backend.query_financials(conn, SNAPSHOT_DIR, symbols, version)
+    query = "SELECT ticker, date, variable, value FROM spx.financials WHERE ticker = ANY(%s)"
+    return postgresql(query, (list(symbols),), dtypes={'date': 'datetime64[ns]', 'value': float}, pool=conn)
 
-    # Close the connection
-    conn.close()
+############################################################################
+# Cache Prewarm
+# A background poller, started once per server process, reads the data version
+# every PREWARM_INTERVAL seconds, more often than the page's DATA_VERSION_TTL.
+# When it changes, the poller loads the default selection of the new version
+# before the page switches to it, and the cached loaders take those results on
+# their first miss, so visitors after a load do not wait for the queries.
+# st.cache_data cannot be filled from the poller, it only stores inside a page run.
+PREWARM_INTERVAL = int(os.getenv('PREWARM_INTERVAL', '15'))
+
+# Number of tickers selected when the page opens
+DEFAULT_TICKER_COUNT = 3
+
+# Shared by all sessions: (data version, {loader key: result}) of the newest prewarm
+@st.cache_resource
+def get_prewarm_store():
+    return {'prewarmed': (None, {})}
+
+def prewarm(conn, version):
+    df_info = load_spx_info(conn, version)
+    symbols = tuple(df_info['symbol'].unique()[:DEFAULT_TICKER_COUNT])
+    return {
+        ('info',): df_info,
+        ('price_dates',): load_spx_price_dates(conn, version),
+        ('prices', symbols): load_spx_prices(conn, symbols, version),
+        ('financials', symbols): load_spx_financials(conn, symbols, version),
+    }
+
+def poll_data_version(conn, store):
+    while True:
+        try:
+            version = read_data_version(conn)
+            if version != store['prewarmed'][0]:
+                # Swap the version and its results in one assignment
+                store['prewarmed'] = (version, prewarm(conn, version))
+        except Exception as e:
+            print(f"Cache prewarm failed: {e}")
+        time.sleep(PREWARM_INTERVAL)
+
+@st.cache_resource
+def start_prewarm_poller():
+    poller = threading.Thread(target=poll_data_version, args=(data_connection(), get_prewarm_store()),
+                              name='prewarm-poller', daemon=True)
+    poller.start()
+    return poller
+
+def prewarmed(key, version, load):
+    # Result prefetched by the poller for this version, or loaded now
+    prewarmed_version, results = get_prewarm_store()['prewarmed']
+    if prewarmed_version == version and key in results:
+        return results[key]
+    return load()
 
-    # Create a DataFrame
-    df = pd.DataFrame(data, columns=colnames)
+############################################################################
+# Data Version
+# Id of the newest ETL run (or snapshot), bumped by every load. The cached loaders
+# take it as an argument, so their entries roll over as soon as new data lands.
+@st.cache_data(ttl=int(os.getenv('DATA_VERSION_TTL', '60')), show_spinner=False)
+def get_data_version():
+    return read_data_version(data_connection())
 
-    # Return DataFrame
-    return df
+# Entries of older data versions are never read again, expire them after a day
+CACHE_TTL = int(os.getenv('CACHE_TTL', '86400'))
 
 ############################################################################
 # Data Caching Functions
 # Get SPX Info
-@st.cache_data
-def get_spx_info(host, user, password, database, port):
-    with st.spinner('Loading SPX Info...'):
-        query = "SELECT * FROM spx.info ORDER BY symbol"
-        df_info = postgresql(query, host, user, password, database, port)
-        # Convert founded to int
-        df_info['founded'] = df_info['founded'].astype(int)
-        # Convert cik to str
-        df_info['cik'] = df_info['cik'].astype(str)
-        return df_info
+@st.cache_data(ttl=CACHE_TTL, show_spinner='Loading SPX Info...')
+def get_spx_info(version):
+    return prewarmed(('info',), version, lambda: load_spx_info(data_connection(), version))
 
 # Get SPX Prices
-@st.cache_data
-def get_spx_prices(symbols, host, user, password, database, port, metrics=['Close']):
-    with st.spinner('Loading SPX Prices...'):
-        symbols_str = ", ".join(f"'{symbol}'" for symbol in symbols)
-        query = f"SELECT * FROM spx.prices WHERE Ticker IN ({symbols_str}) AND ("
-        for metric in metrics:
-            query += f"Metric = '{metric}' OR "
-        query = query[:-4] + ")"
-        df_prices = postgresql(query, host, user, password, database, port)
-        df_prices['date'] = pd.to_datetime(df_prices['date'])
-        return df_prices
+@st.cache_data(ttl=CACHE_TTL, show_spinner='Loading SPX Prices...')
+def get_spx_prices(symbols, version):
+    return prewarmed(('prices', tuple(symbols)), version,
+                     lambda: load_spx_prices(data_connection(), symbols, version))
+
+# Get SPX Price Date Range
+@st.cache_data(ttl=CACHE_TTL)
+def get_spx_price_dates(version):
+    return prewarmed(('price_dates',), version, lambda: load_spx_price_dates(data_connection(), version))
 
 # Get SPX Financials
-@st.cache_data
-def get_spx_financials(symbols, host, user, password, database, port):
-    with st.spinner('Loading SPX Financials...'):
-        symbols_str = ", ".join(f"'{symbol}'" for symbol in symbols)
-        query = f"SELECT * FROM spx.financials WHERE ticker IN ({symbols_str})"
-        df_financials = postgresql(query, host, user, password, database, port)
-        df_financials['date'] = pd.to_datetime(df_financials['date'])
-        return df_financials
+@st.cache_data(ttl=CACHE_TTL, show_spinner='Loading SPX Financials...')
+def get_spx_financials(symbols, version):
+    return prewarmed(('financials', tuple(symbols)), version,
+                     lambda: load_spx_financials(data_connection(), symbols, version))
+
+############################################################################
+# Chart Rendering
+# Width of the price chart in pixels, series are reduced to about one point per pixel
+CHART_WIDTH_PX = int(os.getenv('CHART_WIDTH_PX', '1200'))
+# Traces with more points than this are drawn with WebGL instead of SVG
+WEBGL_MIN_POINTS = int(os.getenv('WEBGL_MIN_POINTS', '1000'))
+
+def minmax_downsample(df, column, n_buckets):
+    # Split each ticker's series into n_buckets consecutive buckets and keep the
+    # first and last point plus the lowest and highest point of every bucket,
+    # so peaks and troughs survive. Expects rows ordered by ticker and date.
+    df = df.reset_index(drop=True)
+    position = df.groupby('ticker').cumcount()
+    length = df.groupby('ticker')['ticker'].transform('size')
+    if length.max() <= 2 * n_buckets:
+        return df
+    bucket = position * n_buckets // length
+    values = df[column].groupby([df['ticker'], bucket])
+    keep = (pd.Index(values.idxmin().dropna().astype(int))
+            .union(pd.Index(values.idxmax().dropna().astype(int)))
+            .union(df.index[(position == 0) | (position == length - 1)]))
+    return df.loc[keep]
+
+############################################################################
+start_prewarm_poller()
+version = get_data_version()
 
 ############################################################################
 # Load SPX Info
-df_info = get_spx_info(host, user, password, database, port)
+df_info = get_spx_info(version)
 
-# Get the first ticker in a list
-symbols = [df_info['symbol'].iloc[0]]
-# Load SPX Prices to get the dates
-df_close = get_spx_prices(symbols, host, user, password, database, port, metrics=['Close'])
-earliest_date = df_close['date'].min()
+# Get the stored price date range
+earliest_date, latest_date = get_spx_price_dates(version)
 # Format as MM-DD-YY (Only two digits for year)
 earliest_date = earliest_date.strftime('%m-%d-%y')
-latest_date = df_close['date'].max()
 latest_date = latest_date.strftime('%m-%d-%y')
 
 ############################################################################
@@ -147,46 +330,43 @@ with col4:
 ############################################################################
 # Get the first three tickers
 try:
-    ticker_list = df_info['symbol'].unique()[:3]
+    ticker_list = list(df_info['symbol'].unique()[:DEFAULT_TICKER_COUNT])
     symbols = st.multiselect('Select Tickers to Visualize', df_info['symbol'].unique(), ticker_list)
 except:
     symbols = st.multiselect('Select Tickers to Visualize', df_info['symbol'].unique(), [])
 
 ############################################################################
-# Load SPX Prices
-df_close = get_spx_prices(symbols, host, user, password, database, port, metrics=['Close'])
-df_open = get_spx_prices(symbols, host, user, password, database, port, metrics=['Open'])
-df_high = get_spx_prices(symbols, host, user, password, database, port, metrics=['High'])
-df_low = get_spx_prices(symbols, host, user, password, database, port, metrics=['Low'])
-df_volume = get_spx_prices(symbols, host, user, password, database, port, metrics=['Volume'])
+# Load SPX Prices (all metrics in one query)
+df_prices = get_spx_prices(symbols, version)
 
 ############################################################################
 # Load SPX Financials
-df_financials = get_spx_financials(symbols, host, user, password, database, port)
+df_financials = get_spx_financials(symbols, version)
 
 ############################################################################
 # Create Filters
 col1, col2 = st.columns(2)
 with col1:
-    # Visualize SPX Metrics
-    tab1, tab2, tab3, tab4, tab5 = st.tabs(["Close", "Open", "High", "Low", "Volume"])
+    # Visualize SPX Metrics, only the figure of the selected metric is built
+    metric = st.radio('Metric', ["Close", "Open", "High", "Low", "Volume"], horizontal=True,
+                      label_visibility='collapsed')
+    full_resolution = st.toggle('Full resolution', value=False,
+                                help='Plot every daily point instead of about one point per pixel')
 
     def visualize_metric(df, metric):
-        fig = px.line(df, x='date', y='value', color='ticker')
+        # Each metric is a column of the wide prices frame
+        column = metric.lower()
+        if not full_resolution:
+            df = minmax_downsample(df, column, CHART_WIDTH_PX // 2)
+        # WebGL keeps large series responsive, SVG looks sharper for small ones
+        points_per_trace = len(df) / max(df['ticker'].nunique(), 1)
+        fig = px.line(df, x='date', y=column, color='ticker',
+                      render_mode='webgl' if points_per_trace > WEBGL_MIN_POINTS else 'svg')
         # Add Title
-        fig.update_layout(title=f'{metric} Prices')
+        fig.update_layout(title=f'{metric} Prices', yaxis_title='value')
         st.plotly_chart(fig, use_container_width=True)
 
-    with tab1:
-        visualize_metric(df_close, 'Close')
-    with tab2:
-        visualize_metric(df_open, 'Open')
-    with tab3:
-        visualize_metric(df_high, 'High')
-    with tab4:
-        visualize_metric(df_low, 'Low')
-    with tab5:
-        visualize_metric(df_volume, 'Volume')
+    visualize_metric(df_prices, metric)
 
 ############################################################################
 # Visualize SPX Financials
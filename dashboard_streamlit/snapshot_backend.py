@@ -0,0 +1,66 @@
+import os
+import json
+import duckdb
+
+############################################################################
+# DuckDB queries over the Parquet snapshot written by 05_export_snapshot
+# (DATA_BACKEND=duckdb). Kept free of Streamlit so it can be unit tested;
+# app.py caches the connection and the results.
+
+def connect():
+    # Embedded in-memory database, the snapshot files are scanned in place
+    return duckdb.connect(database=':memory:')
+
+def read_snapshot_version(snapshot_dir):
+    # Data version of the newest published snapshot
+    with open(os.path.join(snapshot_dir, 'manifest.json')) as file:
+        return int(json.load(file)['version'])
+
+def duckdb_query(con, sql_query, params=None, dtypes=None):
+    # One cursor per query, a DuckDB connection must not be used by two threads at once
+    cur = con.cursor()
+    try:
+        df = cur.execute(sql_query, params).df()
+    finally:
+        cur.close()
+    if dtypes:
+        df = df.astype(dtypes)
+    return df
+
+def snapshot_table(snapshot_dir, table, version):
+    # Parquet scan of a table in the snapshot of a data version
+    path = os.path.join(snapshot_dir, f'v{version}', f'{table}.parquet').replace("'", "''")
+    return f"read_parquet('{path}')"
+
+def in_list(values):
+    # Placeholders of an IN list, DuckDB pushes constant IN lists down to the
+    # Parquet scan and skips row groups whose ticker range holds none of them
+    return ', '.join('?' * len(values)) or 'NULL'
+
+############################################################################
+# Dashboard Queries, returning the same columns and types as the PostgreSQL ones
+def query_info(con, snapshot_dir, version):
+    query = ("SELECT symbol, security, gics_sector, gics_sub_industry, headquarters_location, "
+             f"date_added, cik, founded FROM {snapshot_table(snapshot_dir, 'info', version)} ORDER BY symbol")
+    # founded as int, cik as str
+    return duckdb_query(con, query, dtypes={'founded': int, 'cik': str})
+
+def query_prices(con, snapshot_dir, symbols, version):
+    query = ("SELECT date, ticker, open, high, low, close, volume "
+             f"FROM {snapshot_table(snapshot_dir, 'prices_wide', version)} "
+             f"WHERE ticker IN ({in_list(symbols)}) ORDER BY ticker, date")
+    return duckdb_query(con, query, list(symbols),
+                        dtypes={'date': 'datetime64[ns]', 'open': float, 'high': float,
+                                'low': float, 'close': float, 'volume': float})
+
+def query_price_dates(con, snapshot_dir, version):
+    query = ("SELECT min(date) AS earliest_date, max(date) AS latest_date "
+             f"FROM {snapshot_table(snapshot_dir, 'prices_wide', version)}")
+    df_dates = duckdb_query(con, query, dtypes={'earliest_date': 'datetime64[ns]', 'latest_date': 'datetime64[ns]'})
+    return df_dates['earliest_date'].iloc[0], df_dates['latest_date'].iloc[0]
+
+def query_financials(con, snapshot_dir, symbols, version):
+    query = ("SELECT ticker, date, variable, value "
+             f"FROM {snapshot_table(snapshot_dir, 'financials', version)} "
+             f"WHERE ticker IN ({in_list(symbols)})")
+    return duckdb_query(con, query, list(symbols), dtypes={'date': 'datetime64[ns]', 'value': float})
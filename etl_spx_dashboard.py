@@ -4,6 +4,7 @@ import pendulum
 from airflow import DAG
 from airflow.providers.docker.operators.docker import DockerOperator
 from airflow.utils.dates import days_ago
+from docker.types import Mount
 from datetime import timedelta
 
 pg_creds_path = "/home/juaneshberger/Credentials/pgcreds.json"
@@ -17,6 +18,9 @@ PG_USER = pg_data['user']
 PGPASSWORD = pg_data['password']
 PG_DATABASE = pg_data['database']
 
+# Host directory of the Parquet snapshots, mounted read-only by the Streamlit dashboard
+SNAPSHOT_HOST_DIR = "/home/juaneshberger/spx_snapshot"
+
 default_args = {
     'owner': 'airflow',
     'depends_on_past': False,
@@ -36,7 +40,14 @@ dag = DAG(
 tasks = {
     'source_info': 'spx_01_source_info',
     'source_prices': 'spx_02_source_prices',
-        'source_financials': 'spx_03_source_financials'
+    'compute_indicators': 'spx_04_compute_indicators',
+        'source_financials': 'spx_03_source_financials',
+    'export_snapshot': 'spx_05_export_snapshot'
+}
+
+# Host directories mounted into the containers of the tasks that need them
+task_mounts = {
+    'export_snapshot': [Mount(source=SNAPSHOT_HOST_DIR, target='/snapshot', type='bind')]
 }
 
 task_operators = []
@@ -53,6 +64,7 @@ for task_id, image in tasks.items():
             'PGPASSWORD': PGPASSWORD,
             'DATABASE': PG_DATABASE
         },
+        mounts=task_mounts.get(task_id, []),
         execution_timeout=timedelta(hours=4),
         auto_remove=True,
         dag=dag,
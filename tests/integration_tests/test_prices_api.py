@@ -82,3 +82,33 @@ def test_prices_api_connection():
         
     except Exception as e:
         pytest.fail(f"Test failed: {str(e)}")
+
+def test_prices_api_metric_filter():
+    """Test that metric=/metrics[] restrict the Prices API to the requested metrics"""
+    config = APITestConfig()
+    base_url = f"{config.api_url}api/prices"
+
+    filter_data = requests.get(f"{base_url}/filter_options/", headers=config.headers).json()
+    date_max = filter_data['date_range']['max']
+    date_min = (pd.Timestamp(date_max) - pd.Timedelta(days=30)).date().isoformat()
+    query = f"{base_url}/?symbols[]=AAPL&date_min={date_min}&date_max={date_max}"
+
+    # All five OHLCV metrics without a metric filter
+    all_rows = requests.get(query, headers=config.headers).json()
+    assert len(all_rows) > 0, "No prices returned for AAPL"
+    assert {row['metric'] for row in all_rows} == set(filter_data['metrics']), "Unfiltered request should return every metric"
+
+    # Single metric, as sent by the charts
+    close_rows = requests.get(f"{query}&metric=Close", headers=config.headers).json()
+    assert {row['metric'] for row in close_rows} == {'Close'}, "metric=Close returned other metrics"
+    assert len(close_rows) * len(filter_data['metrics']) == len(all_rows), \
+        f"metric=Close should return 1/{len(filter_data['metrics'])} of the rows, got {len(close_rows)} of {len(all_rows)}"
+
+    # Several metrics with both parameter forms
+    pair_rows = requests.get(f"{query}&metrics[]=Open&metric=Close", headers=config.headers).json()
+    assert {row['metric'] for row in pair_rows} == {'Open', 'Close'}, "metrics[]=Open&metric=Close returned wrong metrics"
+    assert len(pair_rows) == 2 * len(close_rows), "Two metrics should return twice the rows of one"
+
+    # Unknown metrics are rejected instead of silently returning everything
+    response = requests.get(f"{query}&metric=Closing", headers=config.headers)
+    assert response.status_code == 400, f"Unknown metric should return 400, got {response.status_code}"
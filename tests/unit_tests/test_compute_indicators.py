@@ -0,0 +1,70 @@
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Add the project root directory to the Python path
+project_root = Path(__file__).parents[2]
+sys.path.append(str(project_root))
+
+# Use importlib to import from a directory with a numeric prefix
+import importlib
+indicators = importlib.import_module("04_compute_indicators.indicators")
+compute_indicators = indicators.compute_indicators
+INDICATOR_COLUMNS = indicators.INDICATOR_COLUMNS
+
+def synthetic_prices(n_days=400):
+    """Return random walk close prices of two tickers, shuffled to check the sorting."""
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range('2023-01-02', periods=n_days)
+    frames = [pd.DataFrame({'date': dates, 'ticker': ticker,
+                            'close': start * np.exp(np.cumsum(rng.normal(0, 0.02, n_days)))})
+              for ticker, start in [('AAA', 100.0), ('BBB', 20.0)]]
+    return pd.concat(frames).sample(frac=1, random_state=0).reset_index(drop=True)
+
+def test_compute_indicators():
+    """
+    Test that compute_indicators matches a per-ticker pandas reference and
+    returns values within the expected bounds.
+    """
+    df_prices = synthetic_prices()
+    df_indicators = compute_indicators(df_prices)
+
+    assert list(df_indicators.columns) == ['date', 'ticker'] + INDICATOR_COLUMNS, "Unexpected columns"
+    assert len(df_indicators) == len(df_prices), "Should return one row per price row"
+
+    for ticker, df_ticker in df_indicators.groupby('ticker'):
+        close = df_prices[df_prices['ticker'] == ticker].sort_values('date')['close'].reset_index(drop=True)
+        df_ticker = df_ticker.reset_index(drop=True)
+        assert df_ticker['date'].is_monotonic_increasing, "Rows should be ordered by date"
+        # Windows must not leak across tickers
+        pd.testing.assert_series_equal(df_ticker['sma_20'], close.rolling(20).mean(), check_names=False)
+        pd.testing.assert_series_equal(df_ticker['ema_12'], close.ewm(span=12, adjust=False).mean(), check_names=False)
+        pd.testing.assert_series_equal(df_ticker['log_return'], np.log(close).diff(), check_names=False)
+        assert df_ticker['sma_200'].isna().sum() == 199, "SMA 200 should be NaN until its window is full"
+
+    assert df_indicators['rsi_14'].dropna().between(0, 100).all(), "RSI should lie between 0 and 100"
+    assert (df_indicators['drawdown'] <= 0).all(), "Drawdown should never be positive"
+    assert (df_indicators['volatility_20'].dropna() > 0).all(), "Volatility should be positive"
+
+def test_compute_indicators_incremental_tail():
+    """
+    Test that computing a lookback window seeded with the prior peaks gives the
+    same tail as computing the full history.
+    """
+    df_prices = synthetic_prices()
+    df_full = compute_indicators(df_prices)
+
+    cutoff = df_prices['date'].sort_values().unique()[100]
+    prior_peaks = df_prices[df_prices['date'] < cutoff].groupby('ticker')['close'].max().to_dict()
+    df_tail = compute_indicators(df_prices[df_prices['date'] >= cutoff], prior_peaks=prior_peaks)
+
+    # Compare the last 50 days, by then the 200-day SMA of the tail is full and the EMAs have converged
+    new_dates = df_full['date'] >= df_full['date'].max() - pd.Timedelta(days=70)
+    expected = df_full[new_dates].reset_index(drop=True)
+    actual = df_tail[df_tail['date'] >= expected['date'].min()].reset_index(drop=True)
+    pd.testing.assert_frame_equal(actual, expected, check_exact=False, rtol=1e-6)
+
+if __name__ == "__main__":
+    pytest.main()
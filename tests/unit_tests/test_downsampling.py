@@ -0,0 +1,45 @@
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add the Django backend directory to the Python path
+backend_root = Path(__file__).parents[2] / "dashboard_react" / "backend"
+sys.path.append(str(backend_root))
+
+from spx.downsampling import lttb_indices, downsample_prices
+
+def test_lttb_indices_keeps_shape():
+    """
+    Test that lttb_indices returns max_points sorted indices that keep the
+    endpoints and the extremes of the series.
+    """
+    y = np.sin(np.linspace(0, 20, 2500))
+    indices = lttb_indices(y, 300)
+
+    assert len(indices) == 300, "Should select exactly max_points points"
+    assert indices[0] == 0 and indices[-1] == len(y) - 1, "Should keep the first and last points"
+    assert np.all(np.diff(indices) > 0), "Indices should be strictly increasing"
+    assert y[indices].max() > 0.99 and y[indices].min() < -0.99, "Peaks and troughs should be preserved"
+
+def test_lttb_indices_short_series():
+    """
+    Test that series not longer than max_points are returned unchanged.
+    """
+    assert list(lttb_indices(np.arange(5.0), 10)) == [0, 1, 2, 3, 4], "Short series should not be reduced"
+
+def test_downsample_prices_per_ticker():
+    """
+    Test that downsample_prices reduces every ticker separately and keeps the row order.
+    """
+    rows = [{'date': day, 'ticker': ticker, 'close': float(day % 7)}
+            for ticker in ['AAA', 'BBB'] for day in range(100)]
+
+    result = downsample_prices(rows, 10)
+
+    assert [row['ticker'] for row in result] == ['AAA'] * 10 + ['BBB'] * 10, "Each ticker should get max_points rows"
+    assert all(a['date'] < b['date'] for a, b in zip(result, result[1:]) if a['ticker'] == b['ticker']), \
+        "Rows should stay in date order"
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,57 @@
+import pytest
+import json
+import os
+import pandas as pd
+import pyarrow.parquet as pq
+import sys
+from pathlib import Path
+
+# Add the project root directory to the Python path
+project_root = Path(__file__).parents[2]
+sys.path.append(str(project_root))
+
+# Use importlib to import from a directory with a numeric prefix
+import importlib
+snapshot = importlib.import_module("05_export_snapshot.snapshot")
+read_manifest = snapshot.read_manifest
+write_snapshot = snapshot.write_snapshot
+
+def synthetic_prices():
+    """Return 30 days of prices of three tickers, sorted by ticker and date."""
+    dates = pd.bdate_range('2024-01-02', periods=30)
+    return pd.concat([pd.DataFrame({'date': dates, 'ticker': ticker, 'close': range(30)})
+                      for ticker in ['AAA', 'BBB', 'CCC']], ignore_index=True)
+
+def test_write_snapshot(tmp_path):
+    """
+    Test that write_snapshot writes every table to the version directory,
+    publishes a manifest pointing at it and splits rows into row groups.
+    """
+    df_prices = synthetic_prices()
+    assert read_manifest(tmp_path) is None, "Should return None before the first snapshot"
+
+    manifest = write_snapshot({'prices_wide': df_prices}, 7, tmp_path, row_group_size=30)
+
+    assert read_manifest(tmp_path) == manifest, "Manifest on disk should match the returned one"
+    assert manifest['version'] == 7 and manifest['rows'] == {'prices_wide': 90}
+    path = tmp_path / manifest['tables']['prices_wide']
+    pd.testing.assert_frame_equal(pd.read_parquet(path), df_prices, check_dtype=False)
+
+    # Rows sorted by ticker give every row group a single ticker in its statistics
+    metadata = pq.ParquetFile(path).metadata
+    assert metadata.num_row_groups == 3, "Should write one row group per row_group_size rows"
+    for i in range(metadata.num_row_groups):
+        statistics = metadata.row_group(i).column(1).statistics
+        assert statistics.min == statistics.max, "Row group should hold a single ticker"
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')], "No staging files should remain"
+
+def test_write_snapshot_prunes_old_versions(tmp_path):
+    """
+    Test that only the keep newest snapshot versions remain on disk.
+    """
+    for version in [3, 4, 5, 6]:
+        write_snapshot({'prices_wide': synthetic_prices()}, version, tmp_path, keep=2)
+
+    assert sorted(name for name in os.listdir(tmp_path) if name.startswith('v')) == ['v5', 'v6']
+    with open(tmp_path / 'manifest.json') as file:
+        assert json.load(file)['version'] == 6, "Manifest should point at the newest version"
@@ -51,5 +51,31 @@ def test_fetch_stock_prices():
     expected_metrics = ['Open', 'High', 'Low', 'Close', 'Volume']
     assert set(expected_metrics).issubset(set(df['Metric'])), "Not all expected metrics are present"
 
+def test_fetch_stock_prices_wide():
+    """
+    Test the wide layout of fetch_stock_prices.
+
+    This test checks that layout='wide' returns one row per date and symbol with
+    the OHLCV values as columns, in the column order of spx.prices_wide.
+    """
+    symbols = ['AAPL', 'GOOGL', 'MSFT']
+    end_date = datetime.now() - timedelta(days=1)
+    start_date = end_date - timedelta(days=7)
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=DeprecationWarning, module="tqdm")
+        df = fetch_stock_prices(symbols, start_date, end_date, layout='wide')
+
+    # Check for the columns of spx.prices_wide in table order
+    expected_columns = ['Date', 'Ticker', 'Open', 'High', 'Low', 'Close', 'Volume']
+    assert list(df.columns) == expected_columns, "DataFrame columns should match spx.prices_wide"
+
+    # Check if DataFrame is not empty and has one row per date and symbol
+    assert not df.empty, "DataFrame should not be empty"
+    assert not df.duplicated(subset=['Date', 'Ticker']).any(), "Each date and symbol should appear once"
+
+    # Check if all requested symbols are present
+    assert set(symbols).issubset(set(df['Ticker'])), "Not all requested symbols are present in the result"
+
 if __name__ == "__main__":
     pytest.main()
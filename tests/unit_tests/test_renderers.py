@@ -0,0 +1,55 @@
+import pytest
+import json
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add the Django backend directory to the Python path and load its settings
+backend_root = Path(__file__).parents[2] / "dashboard_react" / "backend"
+sys.path.append(str(backend_root))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'api.settings')
+import django
+django.setup()
+
+from spx.renderers import FastJSONRenderer, ColumnarJSONRenderer, to_columnar
+
+def test_fast_json_renderer_writes_nan_as_null():
+    """
+    Test that FastJSONRenderer encodes dates and writes NaN/Inf values as null.
+    """
+    rows = [{'date': date(2024, 3, 31), 'value': float('nan')},
+            {'date': date(2024, 6, 30), 'value': float('inf')},
+            {'date': date(2024, 9, 30), 'value': 1.5}]
+
+    result = json.loads(FastJSONRenderer().render(rows))
+
+    assert [row['value'] for row in result] == [None, None, 1.5], "Non-finite values should become null"
+    assert result[0]['date'] == '2024-03-31', "Dates should be encoded as ISO strings"
+
+def test_to_columnar_groups_series():
+    """
+    Test that to_columnar returns one object of column arrays per ticker and metric.
+    """
+    rows = [{'date': day, 'ticker': ticker, 'metric': metric, 'value': float(day)}
+            for day in range(3) for ticker in ['AAA', 'BBB'] for metric in ['Close', 'Open']]
+
+    result = to_columnar(rows, ('ticker', 'metric'))
+
+    assert len(result) == 4, "There should be one series per ticker and metric"
+    assert result[0] == {'ticker': 'AAA', 'metric': 'Close', 'date': [0, 1, 2], 'value': [0.0, 1.0, 2.0]}, \
+        "Each series should hold its dates and values in row order"
+
+def test_columnar_renderer_keeps_pagination():
+    """
+    Test that ColumnarJSONRenderer regroups the results of a paginated response.
+    """
+    data = {'next': None, 'results': [{'date': '2024-01-02', 'ticker': 'AAA', 'value': 1.0}]}
+
+    result = json.loads(ColumnarJSONRenderer().render(data))
+
+    assert result == {'next': None, 'results': [{'ticker': 'AAA', 'date': ['2024-01-02'], 'value': [1.0]}]}, \
+        "Paginated results should be columnar while the next link is kept"
+
+if __name__ == "__main__":
+    pytest.main()
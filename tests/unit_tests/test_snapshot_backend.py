@@ -0,0 +1,62 @@
+import pytest
+import pandas as pd
+import sys
+from pathlib import Path
+
+duckdb = pytest.importorskip("duckdb")
+
+# Add the project root and the Streamlit dashboard directories to the Python path
+project_root = Path(__file__).parents[2]
+sys.path.append(str(project_root))
+sys.path.append(str(project_root / "dashboard_streamlit"))
+
+# Use importlib to import from a directory with a numeric prefix
+import importlib
+write_snapshot = importlib.import_module("05_export_snapshot.snapshot").write_snapshot
+
+import snapshot_backend
+from snapshot_backend import in_list
+
+@pytest.fixture
+def snapshot_dir(tmp_path):
+    """Write a snapshot of three tickers, like 05_export_snapshot does, and return its directory."""
+    dates = pd.bdate_range('2024-01-02', periods=30)
+    df_prices = pd.concat([pd.DataFrame({'date': dates, 'ticker': ticker, 'open': 1.0, 'high': 2.0,
+                                         'low': 0.5, 'close': range(30), 'volume': 100})
+                           for ticker in ['AAA', 'BBB', 'CCC']], ignore_index=True)
+    df_financials = pd.DataFrame({'ticker': ['AAA', 'BBB', 'CCC'], 'date': dates[:3],
+                                  'variable': 'Total Revenue', 'value': [1.0, 2.0, 3.0]})
+    write_snapshot({'prices_wide': df_prices, 'financials': df_financials}, 12, tmp_path, row_group_size=30)
+    return tmp_path
+
+def test_in_list():
+    """
+    Test that in_list returns one placeholder per value, and a list matching nothing when empty.
+    """
+    assert in_list(['AAA', 'BBB']) == '?, ?'
+    assert in_list([]) == 'NULL'
+
+def test_query_prices(snapshot_dir):
+    """
+    Test that query_prices returns the OHLCV rows of the selected tickers from the snapshot.
+    """
+    con = snapshot_backend.connect()
+    version = snapshot_backend.read_snapshot_version(snapshot_dir)
+    assert version == 12, "Should read the version from the manifest"
+
+    df_prices = snapshot_backend.query_prices(con, snapshot_dir, ['CCC', 'AAA'], version)
+    assert list(df_prices.columns) == ['date', 'ticker', 'open', 'high', 'low', 'close', 'volume']
+    assert df_prices['ticker'].unique().tolist() == ['AAA', 'CCC'], "Should be filtered and ordered by ticker"
+    assert len(df_prices) == 60 and df_prices['date'].dtype == 'datetime64[ns]'
+    assert df_prices['volume'].dtype == float
+
+    assert snapshot_backend.query_prices(con, snapshot_dir, [], version).empty, "No tickers should match no rows"
+    earliest_date, latest_date = snapshot_backend.query_price_dates(con, snapshot_dir, version)
+    assert earliest_date == pd.Timestamp('2024-01-02') and latest_date == df_prices['date'].max()
+
+def test_query_financials(snapshot_dir):
+    """
+    Test that query_financials (through duckdb_query) filters the financials by ticker.
+    """
+    df_financials = snapshot_backend.query_financials(snapshot_backend.connect(), snapshot_dir, ['BBB'], 12)
+    assert df_financials[['ticker', 'value']].values.tolist() == [['BBB', 2.0]]
@@ -0,0 +1,64 @@
+import pytest
+import time
+import sys
+from pathlib import Path
+
+# Add the project root directory to the Python path
+project_root = Path(__file__).parents[2]
+sys.path.append(str(project_root))
+
+# Use importlib to import from a directory with a numeric prefix
+import importlib
+throttling = importlib.import_module("03_source_financials.throttling")
+TokenBucket = throttling.TokenBucket
+retry_with_backoff = throttling.retry_with_backoff
+map_ordered = throttling.map_ordered
+
+def test_map_ordered_keeps_input_order():
+    """
+    Test that map_ordered yields results in input order even when later
+    items finish first on the thread pool.
+    """
+    def slow_square(x):
+        time.sleep(0.05 * (5 - x))
+        return x * x
+
+    results = list(map_ordered(slow_square, range(6), max_workers=4))
+
+    assert results == [x * x for x in range(6)], "Results should follow the input order"
+
+def test_retry_with_backoff_retries_until_success():
+    """
+    Test that retry_with_backoff retries failing calls and returns the first success.
+    """
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("throttled")
+        return "ok"
+
+    assert retry_with_backoff(flaky, retries=3, base_delay=0.01) == "ok", "Should return the successful result"
+    assert len(attempts) == 3, "Should stop retrying after the first success"
+
+    with pytest.raises(ConnectionError):
+        retry_with_backoff(lambda: (_ for _ in ()).throw(ConnectionError("down")), retries=1, base_delay=0.01)
+
+def test_token_bucket_limits_rate():
+    """
+    Test that TokenBucket allows an initial burst and then throttles to its rate.
+    """
+    bucket = TokenBucket(rate=20, capacity=5)
+
+    start = time.monotonic()
+    for _ in range(15):
+        bucket.acquire()
+    elapsed = time.monotonic() - start
+
+    # 5 tokens are available immediately, the other 10 arrive at 20 per second
+    assert elapsed >= 0.45, "Acquiring beyond the burst should be throttled"
+    assert elapsed < 2, "Throttling should not be much slower than the configured rate"
+
+if __name__ == "__main__":
+    pytest.main()